@@ -128,7 +128,8 @@ def _call_image_generation_api(
         primary_color: Brand primary color for fallback gradient
         
     Returns:
-        ImageAsset with path and metadata
+        ImageAsset with path and metadata; the generated image is also kept
+        in memory on ImageAsset.image so Composition can skip re-decoding it
     """
     settings = get_settings()
     design_model = settings.design_model
@@ -149,6 +150,7 @@ def _call_image_generation_api(
     # TODO: Actual API call would go here
     # For now, generate a fallback gradient background
     
+    fallback_img = None
     if not output_path.exists():
         # Generate a gradient background using brand colors
         fallback_img = _generate_fallback_background(
@@ -168,6 +170,7 @@ def _call_image_generation_api(
         prompt_used=prompt_package["prompt"],
         width=prompt_package["width"],
         height=prompt_package["height"],
+        image=fallback_img,
     )
 
 
@@ -4,9 +4,10 @@ Composition Module for Sartor Ad Engine.
 Provides deterministic ad composition: background scene + product image + text → final ad.
 """
 
-from src.composition.compositor import Compositor, CompositionInput
+from src.composition.compositor import Compositor, CompositionInput, warm_caches
 
 __all__ = [
     "Compositor",
     "CompositionInput",
+    "warm_caches",
 ]
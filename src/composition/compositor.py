@@ -4,16 +4,26 @@ Main compositor for ad composition.
 Orchestrates the full composition pipeline: background + product + text + logo → final ad.
 """
 
+import asyncio
 import logging
 from io import BytesIO
 from pathlib import Path
 from typing import Literal
 
 from PIL import Image, ImageDraw
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.composition.product_placer import place_product, load_product_image
-from src.composition.templates.layout_specs import get_layout_spec, LayoutZone
+from src.composition.product_placer import (
+    RESIZE_REDUCING_GAP,
+    load_product_image,
+    place_product,
+)
+from src.composition.templates.layout_specs import (
+    get_layout_spec,
+    list_archetypes,
+    LayoutZone,
+    PixelRect,
+)
 from src.composition.text_renderer import (
     render_headline,
     render_subheadline,
@@ -21,20 +31,50 @@ from src.composition.text_renderer import (
     render_cta_button,
     render_disclaimer,
     load_font,
+    draw_text,
 )
 from src.models.assets import ImageAsset
 from src.models.brand import BrandContext, BrandStrategyType
 from src.models.channel import ChannelContext
 from src.models.concept import CreativeConcept
 from src.models.copy import AdCopy
+from src.utils.image_utils import close_http_client
 
 logger = logging.getLogger(__name__)
 
 
+def _is_placeholder_url(url: str) -> bool:
+    """Known placeholder logo URLs that should never be fetched."""
+    return "example.com" in url or "placeholder" in url.lower()
+
+
+def warm_caches(width: int, height: int) -> None:
+    """
+    Preload the layout geometry and fonts a canvas of this size will use.
+    
+    Only moves cold-start work earlier (e.g. onto a thread while an LLM call
+    is in flight); composition output is unaffected.
+    """
+    for name in list_archetypes():
+        layout = get_layout_spec(name)
+        layout.pixel_rects(width, height)
+        load_font("bold", int(height * layout.headline_font_ratio))
+        load_font("regular", int(height * layout.body_font_ratio))
+        load_font("semibold", int(height * layout.cta_font_ratio))
+    load_font("semibold", int(height * 0.030))  # Subheadline
+    load_font("regular", int(height * 0.018))   # CTA urgency / availability line
+    load_font("regular", 12)                    # Disclaimer
+
+
 class CompositionInput(BaseModel):
     """Validated input for ad composition."""
     
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     background_path: str = Field(..., description="Path to background scene image")
+    background_image: Image.Image | None = Field(
+        None, description="Already-decoded background; used instead of reading background_path"
+    )
     product_image_source: str = Field(..., description="URL or path to product image")
     ad_copy: AdCopy
     concept: CreativeConcept
@@ -44,6 +84,9 @@ class CompositionInput(BaseModel):
     channel: ChannelContext
     output_path: str = Field(..., description="Where to save final ad")
     output_format: Literal["PNG", "JPEG"] = "PNG"
+    png_compress_level: int = Field(
+        6, ge=0, le=9, description="zlib level for PNG output (1 = fastest encode)"
+    )
     remove_product_bg: bool = True
 
 
@@ -71,6 +114,14 @@ class Compositor:
         5. Add legal disclaimer if present
         6. Export final image
         
+        CPU-bound PIL stages run via asyncio.to_thread so concurrent
+        compositions don't block the event loop.
+        
+        Remote product images are fetched with the running loop's pooled
+        HTTP client (see get_http_client). The client is left open so
+        concurrent compositions can share it; callers that own the loop must
+        await close_http_client() before it ends (compose_ad does this).
+        
         Args:
             input: Validated composition input
             
@@ -83,39 +134,64 @@ class Compositor:
         layout = get_layout_spec(input.concept.layout_archetype)
         self.logger.info(f"Using layout: {layout.name}")
         
-        # Step 1: Load and resize background
-        canvas = self._load_background(
-            input.background_path,
-            input.channel.dimensions.width,
-            input.channel.dimensions.height,
-        )
-        self.logger.info(f"Background loaded: {canvas.size}")
-        
-        # Step 2: Place product
-        canvas = await place_product(
-            canvas,
-            input.product_image_source,
-            input.concept.product_placement,
-            layout.product_zone,
-            remove_bg=input.remove_product_bg,
-        )
-        self.logger.info("Product placed")
+        # Start logo fetches now so their network latency overlaps the
+        # background/product work below
+        logo_fetches = self._prefetch_logos(input)
         
-        # Step 3: Render text
-        canvas = self._render_all_text(canvas, input, layout)
-        self.logger.info("Text rendered")
-        
-        # Step 4: Add logos
-        canvas = await self._render_logos(canvas, input, layout)
-        self.logger.info("Logos added")
+        try:
+            # Step 1: Load and resize background (product fetched alongside)
+            canvas, product_image = await asyncio.gather(
+                asyncio.to_thread(
+                    self._load_background,
+                    input.background_path,
+                    input.channel.dimensions.width,
+                    input.channel.dimensions.height,
+                    input.background_image,
+                ),
+                load_product_image(input.product_image_source),
+            )
+            self.logger.info(f"Background loaded: {canvas.size}")
+            
+            # Resolve layout zones to pixels once for this canvas
+            rects = layout.pixel_rects(canvas.width, canvas.height)
+            
+            # Step 2: Place product
+            canvas = await place_product(
+                canvas,
+                input.product_image_source,
+                input.concept.product_placement,
+                layout.product_zone,
+                remove_bg=input.remove_product_bg,
+                product_image=product_image,
+            )
+            self.logger.info("Product placed")
+            
+            # Step 3: Render text
+            canvas = await asyncio.to_thread(self._render_all_text, canvas, input, layout, rects)
+            self.logger.info("Text rendered")
+            
+            # Step 4: Add logos
+            canvas = await self._render_logos(canvas, input, rects, logo_fetches)
+            self.logger.info("Logos added")
+        finally:
+            for task in logo_fetches.values():
+                task.cancel()
         
         # Step 5: Add legal disclaimer
         if input.ad_copy.legal_disclaimer:
-            canvas = render_disclaimer(canvas, input.ad_copy.legal_disclaimer)
+            canvas = await asyncio.to_thread(
+                render_disclaimer, canvas, input.ad_copy.legal_disclaimer
+            )
             self.logger.info("Disclaimer added")
         
         # Step 6: Export
-        output_path = self._save_image(canvas, input.output_path, input.output_format)
+        output_path = await asyncio.to_thread(
+            self._save_image,
+            canvas,
+            input.output_path,
+            input.output_format,
+            input.png_compress_level,
+        )
         self.logger.info(f"Saved to: {output_path}")
         
         return ImageAsset(
@@ -124,22 +200,53 @@ class Compositor:
             height=canvas.height,
         )
     
+    def _prefetch_logos(self, input: CompositionInput) -> dict[str, asyncio.Task]:
+        """Start fetching the remote logos the brand strategy will place, keyed by URL."""
+        brands = {
+            "store_dominant": [input.store_brand],
+            "product_dominant": [input.product_brand],
+            "co_branded": [input.store_brand, input.product_brand],
+        }.get(input.brand_strategy, [])
+        urls = {
+            brand.logo_url
+            for brand in brands
+            if brand
+            and brand.logo_url
+            and brand.logo_url.startswith(("http://", "https://"))
+            and not _is_placeholder_url(brand.logo_url)
+        }
+        return {url: asyncio.create_task(load_product_image(url)) for url in urls}
+    
     def _load_background(
         self,
         path: str,
         target_width: int,
         target_height: int,
+        image: Image.Image | None = None,
     ) -> Image.Image:
-        """Load background and resize to exact dimensions."""
-        bg = Image.open(path)
+        """Load background (or reuse an in-memory image) and resize to exact dimensions."""
+        bg = image if image is not None else Image.open(path)
+        
+        # Let libjpeg downscale in the DCT domain while decoding oversized
+        # JPEGs; the Lanczos pass below still sets final quality (no-op for PNG)
+        if bg.format == "JPEG":
+            bg.draft(
+                "RGB",
+                (int(target_width * RESIZE_REDUCING_GAP), int(target_height * RESIZE_REDUCING_GAP)),
+            )
         
         # Convert to RGB (no transparency for background)
         if bg.mode != "RGB":
             bg = bg.convert("RGB")
         
-        # Resize to exact dimensions (may distort slightly)
+        # Resize to exact dimensions (may distort slightly).
+        # reducing_gap lets Pillow box-reduce large sources before the Lanczos pass.
         if bg.size != (target_width, target_height):
-            bg = bg.resize((target_width, target_height), Image.Resampling.LANCZOS)
+            bg = bg.resize(
+                (target_width, target_height),
+                Image.Resampling.LANCZOS,
+                reducing_gap=RESIZE_REDUCING_GAP,
+            )
         
         # Convert to RGBA for compositing
         return bg.convert("RGBA")
@@ -155,6 +262,7 @@ class Compositor:
         canvas: Image.Image,
         input: CompositionInput,
         layout,
+        rects: dict[str, PixelRect],
     ) -> Image.Image:
         """Render all text elements."""
         dominant_brand = self._get_dominant_brand(input)
@@ -166,15 +274,19 @@ class Compositor:
         # Determine text color based on background
         text_color = self._get_contrasting_text_color(primary_color)
         
+        # One drawing context shared by every text element
+        draw = ImageDraw.Draw(canvas)
+        
         current_y_offset = 0
         
         # Headline
         canvas, headline_height = render_headline(
             canvas,
             input.ad_copy.headline,
-            layout.headline_zone,
+            rects["headline_zone"],
             primary_color,
             font_size_ratio=layout.headline_font_ratio,
+            draw=draw,
         )
         current_y_offset = headline_height + 20  # Add spacing
         
@@ -183,8 +295,9 @@ class Compositor:
             canvas, subheadline_height = render_subheadline(
                 canvas,
                 input.ad_copy.subheadline,
-                layout.headline_zone,
+                rects["headline_zone"],
                 y_offset=current_y_offset,
+                draw=draw,
             )
             current_y_offset += subheadline_height + 15
         
@@ -193,32 +306,38 @@ class Compositor:
             canvas, body_height = render_body(
                 canvas,
                 input.ad_copy.body_copy,
-                layout.body_zone,
+                rects["body_zone"],
                 color="#FFFFFF",
                 font_size_ratio=layout.body_font_ratio,
+                draw=draw,
             )
         
         # CTA button
         canvas = render_cta_button(
             canvas,
             input.ad_copy.cta_text,
-            layout.cta_zone,
+            rects["cta_zone"],
             accent_color,
             font_size_ratio=layout.cta_font_ratio,
+            draw=draw,
         )
         
         # CTA urgency (if present)
         if input.ad_copy.cta_urgency:
-            draw = ImageDraw.Draw(canvas)
-            font = load_font("regular", int(canvas.height * 0.018))
-            x1, y1, x2, y2 = layout.cta_zone.get_bounds(canvas.width, canvas.height)
+            font = load_font(
+                "regular",
+                int(canvas.height * 0.018),
+                complex_script=not input.ad_copy.cta_urgency.isascii(),
+            )
+            cta_rect = rects["cta_zone"]
             # Place urgency text below CTA
-            urgency_y = y2 + 10
-            draw.text(
-                (x1, urgency_y),
+            urgency_y = cta_rect.y2 + 10
+            draw_text(
+                draw,
+                (cta_rect.x1, urgency_y),
                 input.ad_copy.cta_urgency,
-                font=font,
-                fill="#FFCC00",  # Warning/urgency color
+                font,
+                "#FFCC00",  # Warning/urgency color
             )
         
         return canvas
@@ -227,7 +346,8 @@ class Compositor:
         self,
         canvas: Image.Image,
         input: CompositionInput,
-        layout,
+        rects: dict[str, PixelRect],
+        logo_fetches: dict[str, asyncio.Task] | None = None,
     ) -> Image.Image:
         """
         Render logos based on brand strategy.
@@ -235,11 +355,14 @@ class Compositor:
         - store_dominant: Store logo in logo_zone
         - product_dominant: Product logo + "Available at [Store]"
         - co_branded: Both logos
+        
+        logo_fetches holds in-flight logo downloads started by compose().
         """
-        logo_zone = layout.logo_zone
-        x1, y1, x2, y2 = logo_zone.get_bounds(canvas.width, canvas.height)
-        zone_width = x2 - x1
-        zone_height = y2 - y1
+        logo_fetches = logo_fetches or {}
+        logo_rect = rects["logo_zone"]
+        x1, y1 = logo_rect.x1, logo_rect.y1
+        zone_width = logo_rect.w
+        zone_height = logo_rect.h
         
         if input.brand_strategy == "store_dominant":
             # Store logo only
@@ -248,6 +371,7 @@ class Compositor:
                 input.store_brand.logo_url,
                 (x1, y1),
                 max_height=zone_height,
+                prefetched=logo_fetches.get(input.store_brand.logo_url),
                 brand_name=input.store_brand.brand_name,
             )
         
@@ -258,18 +382,24 @@ class Compositor:
                 input.product_brand.logo_url,
                 (x1, y1),
                 max_height=zone_height,
+                prefetched=logo_fetches.get(input.product_brand.logo_url),
                 brand_name=input.product_brand.brand_name,
             )
             
             # "Available at [Store]" text at bottom
             draw = ImageDraw.Draw(canvas)
-            font = load_font("regular", int(canvas.height * 0.018))
             available_text = f"Available at {input.store_brand.brand_name}"
-            draw.text(
+            font = load_font(
+                "regular",
+                int(canvas.height * 0.018),
+                complex_script=not available_text.isascii(),
+            )
+            draw_text(
+                draw,
                 (10, canvas.height - 30),
                 available_text,
-                font=font,
-                fill="#CCCCCC",
+                font,
+                "#CCCCCC",
             )
         
         elif input.brand_strategy == "co_branded":
@@ -283,6 +413,7 @@ class Compositor:
                 (x1, y1),
                 max_width=half_width - 10,
                 max_height=zone_height,
+                prefetched=logo_fetches.get(input.store_brand.logo_url),
                 brand_name=input.store_brand.brand_name,
             )
             
@@ -294,6 +425,7 @@ class Compositor:
                     (x1 + half_width + 10, y1),
                     max_width=half_width - 10,
                     max_height=zone_height,
+                    prefetched=logo_fetches.get(input.product_brand.logo_url),
                     brand_name=input.product_brand.brand_name,
                 )
         
@@ -306,6 +438,7 @@ class Compositor:
         position: tuple[int, int],
         max_width: int = None,
         max_height: int = None,
+        prefetched: asyncio.Task | None = None,
         brand_name: str = None,
     ) -> Image.Image:
         """Load and place a logo on the canvas. Falls back to text-based logo if loading fails."""
@@ -316,14 +449,16 @@ class Compositor:
             
         try:
             # Skip known placeholder URLs
-            if "example.com" in logo_source or "placeholder" in logo_source.lower():
+            if _is_placeholder_url(logo_source):
                 self.logger.debug(f"Skipping placeholder logo URL: {logo_source}")
                 if brand_name:
                     return self._render_text_logo(canvas, brand_name, position, max_height)
                 return canvas
             
             # Load logo
-            if logo_source.startswith(("http://", "https://")):
+            if prefetched is not None:
+                logo = await prefetched
+            elif logo_source.startswith(("http://", "https://")):
                 logo = await load_product_image(logo_source)
             else:
                 logo = Image.open(logo_source).convert("RGBA")
@@ -332,8 +467,8 @@ class Compositor:
             if max_width or max_height:
                 logo = self._resize_to_fit(logo, max_width, max_height)
             
-            # Composite onto canvas
-            canvas.paste(logo, position, logo if logo.mode == "RGBA" else None)
+            # Composite onto canvas (logos are loaded as RGBA)
+            canvas.alpha_composite(logo, position)
             
         except Exception as e:
             self.logger.warning(f"Failed to load logo from {logo_source}: {e}")
@@ -353,8 +488,8 @@ class Compositor:
         """Render brand name as a text-based logo fallback."""
         draw = ImageDraw.Draw(canvas)
         font_size = min(max_height or 30, 30)
-        font = load_font("bold", font_size)
-        draw.text(position, brand_name, font=font, fill="#FFFFFF")
+        font = load_font("bold", font_size, complex_script=not brand_name.isascii())
+        draw_text(draw, position, brand_name, font, "#FFFFFF")
         return canvas
     
     def _resize_to_fit(
@@ -382,11 +517,14 @@ class Compositor:
         """Get a text color that contrasts with the background."""
         # Simple luminance check
         try:
-            # Remove # and parse hex
+            # Remove # and parse RRGGBB in one shot
             hex_color = background_color.lstrip("#")
-            r, g, b = int(hex_color[:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-            luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-            return "#000000" if luminance > 0.5 else "#FFFFFF"
+            if len(hex_color) < 6:
+                return "#FFFFFF"
+            rgb = int(hex_color[:6], 16)
+            # Integer Rec. 601 luma, scaled by 1000 (0.5 * 255 * 1000 = 127500)
+            luminance = 299 * (rgb >> 16) + 587 * ((rgb >> 8) & 0xFF) + 114 * (rgb & 0xFF)
+            return "#000000" if luminance > 127500 else "#FFFFFF"
         except Exception:
             return "#FFFFFF"
     
@@ -395,23 +533,38 @@ class Compositor:
         image: Image.Image,
         path: str,
         format: str,
+        compress_level: int = 6,
     ) -> Path:
-        """Save image to disk."""
+        """
+        Save image to disk.
+        
+        PNG is written with the given zlib level and without the extra
+        optimize pass; level 1 encodes several times faster than the default
+        6 for a modestly larger file. A missing parent directory is
+        created on first use rather than checked on every save.
+        """
         output_path = Path(path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Convert to RGB for JPEG
         if format == "JPEG" and image.mode == "RGBA":
-            # Composite onto white background
-            background = Image.new("RGB", image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[-1])
-            image = background
+            # Composite onto white background in one pass (no band split)
+            background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+            image = Image.alpha_composite(background, image).convert("RGB")
         
         save_kwargs = {}
         if format == "JPEG":
-            save_kwargs["quality"] = 95
+            # Baseline (non-progressive) with optimized Huffman tables and
+            # 4:2:0 chroma subsampling: smaller files with no visible loss
+            save_kwargs.update(quality=95, optimize=True, progressive=False, subsampling=2)
+        else:
+            save_kwargs.update(compress_level=compress_level, optimize=False)
         
-        image.save(output_path, format=format, **save_kwargs)
+        try:
+            image.save(output_path, format=format, **save_kwargs)
+        except FileNotFoundError:
+            # Only the first save into a new directory pays for mkdir
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            image.save(output_path, format=format, **save_kwargs)
         return output_path
 
 
@@ -431,6 +584,9 @@ async def compose_ad(
     """
     Convenience function to compose an ad.
     
+    Closes the event loop's pooled HTTP client when done, so it is safe to
+    call once per asyncio.run.
+    
     Args:
         background_path: Path to background scene
         product_image_source: URL or path to product image
@@ -460,4 +616,8 @@ async def compose_ad(
     )
     
     compositor = Compositor()
-    return await compositor.compose(input)
+    try:
+        return await compositor.compose(input)
+    finally:
+        # One-shot helper: don't leak the loop's pooled client past this call
+        await close_http_client()
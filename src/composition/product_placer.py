@@ -4,7 +4,13 @@ Product image placement for ad composition.
 Handles loading, background removal, sizing, and positioning of product images.
 """
 
+import asyncio
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Literal
@@ -12,7 +18,9 @@ from typing import Literal
 from PIL import Image, ImageFilter
 
 from src.composition.templates.layout_specs import LayoutZone
+from src.config import get_settings
 from src.models.concept import ProductPlacement
+from src.utils.image_utils import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +31,68 @@ SIZE_MULTIPLIERS: dict[str, float] = {
     "subtle": 0.30,
 }
 
+# Pillow pre-reduces by an integer factor while the source is at least this many
+# times larger than the target (see Image.resize reducing_gap)
+RESIZE_REDUCING_GAP = 2.0
+
+# Decoded remote images kept in memory, keyed by URL (oldest evicted first).
+# Entries are (fetched_at, image); shared across threads, so guarded by a lock
+REMOTE_IMAGE_CACHE_SIZE = 256
+_remote_image_cache: OrderedDict[str, tuple[float, Image.Image]] = OrderedDict()
+_remote_image_cache_lock = threading.Lock()
+
+
+def _cache_path(namespace: str, key: bytes) -> Path:
+    """On-disk cache location for a content key."""
+    digest = hashlib.sha256(key).hexdigest()
+    return get_settings().cache_dir / namespace / f"{digest}.png"
+
+
+def _write_cache(path: Path, image: Image.Image) -> None:
+    """Persist a cache entry; failures only cost a future cache miss."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        image.save(path, "PNG")
+    except OSError as e:
+        logger.warning(f"Could not write image cache {path}: {e}")
+
+
+def _is_fresh(fetched_at: float) -> bool:
+    """Whether a remote image fetched at this time is still within the TTL."""
+    ttl = get_settings().remote_image_cache_ttl
+    return ttl > 0 and time.time() - fetched_at < ttl
+
+
+def _recall_remote_image(url: str) -> Image.Image | None:
+    """Return a fresh in-memory copy of a remote image, if cached."""
+    with _remote_image_cache_lock:
+        entry = _remote_image_cache.get(url)
+        if entry is None:
+            return None
+        if not _is_fresh(entry[0]):
+            del _remote_image_cache[url]
+            return None
+        _remote_image_cache.move_to_end(url)
+        return entry[1].copy()
+
+
+def _remember_remote_image(url: str, image: Image.Image, fetched_at: float) -> None:
+    """Add a decoded image to the in-memory cache."""
+    with _remote_image_cache_lock:
+        _remote_image_cache[url] = (fetched_at, image)
+        _remote_image_cache.move_to_end(url)
+        while len(_remote_image_cache) > REMOTE_IMAGE_CACHE_SIZE:
+            _remote_image_cache.popitem(last=False)
+
 
 async def load_product_image(source: str) -> Image.Image:
     """
     Load product image from URL or local path.
     
+    Remote images are cached in memory and under settings.cache_dir for
+    settings.remote_image_cache_ttl seconds; after that the URL is fetched
+    again so a changed product shot is picked up.
+    
     Args:
         source: HTTP(S) URL or local file path
         
@@ -39,11 +104,27 @@ async def load_product_image(source: str) -> Image.Image:
         httpx.HTTPError: If URL fetch fails
     """
     if source.startswith(("http://", "https://")):
-        import httpx
-        async with httpx.AsyncClient() as client:
-            response = await client.get(source, timeout=30.0)
+        cached = _recall_remote_image(source)
+        if cached is not None:
+            return cached
+        
+        cache_path = _cache_path("remote", source.encode())
+        try:
+            fetched_at = cache_path.stat().st_mtime
+        except OSError:
+            fetched_at = None
+        
+        if fetched_at is not None and _is_fresh(fetched_at):
+            image = Image.open(cache_path).convert("RGBA")
+        else:
+            response = await get_http_client().get(source, timeout=30.0)
             response.raise_for_status()
-            image = Image.open(BytesIO(response.content))
+            image = Image.open(BytesIO(response.content)).convert("RGBA")
+            fetched_at = time.time()
+            _write_cache(cache_path, image)
+        
+        _remember_remote_image(source, image, fetched_at)
+        return image.copy()
     else:
         path = Path(source)
         if not path.exists():
@@ -58,18 +139,54 @@ def remove_background(image: Image.Image) -> Image.Image:
     """
     Remove background from product image using rembg.
     
+    Results are cached on disk keyed by the source pixels, so repeat
+    product images skip the segmentation model entirely.
+    
     Args:
         image: PIL Image (any mode)
         
     Returns:
         PIL Image in RGBA mode with transparent background
     """
+    key = f"{get_settings().rembg_model}:{image.mode}:{image.size}:".encode() + image.tobytes()
+    cache_path = _cache_path("rembg", key)
+    if cache_path.exists():
+        logger.info("Using cached background removal")
+        return Image.open(cache_path).convert("RGBA")
+    
+    result = _run_rembg(image)
+    _write_cache(cache_path, result)
+    return result
+
+
+@lru_cache(maxsize=1)
+def _get_rembg_session():
+    """
+    Load the rembg model once per process.
+    
+    Without a session rembg reloads the ONNX model on every call. GPU
+    execution providers are preferred when onnxruntime exposes them.
+    """
+    import onnxruntime
+    from rembg import new_session
+    
+    preferred = ["CUDAExecutionProvider", "CoreMLExecutionProvider", "CPUExecutionProvider"]
+    available = set(onnxruntime.get_available_providers())
+    providers = [p for p in preferred if p in available] or None
+    
+    model = get_settings().rembg_model
+    logger.info(f"Loading rembg model '{model}' (providers: {providers})")
+    return new_session(model, providers=providers)
+
+
+def _run_rembg(image: Image.Image) -> Image.Image:
+    """Run rembg on an image and return the RGBA result."""
     from rembg import remove
     
     logger.info("Removing background from product image...")
     
     # rembg works directly with PIL images
-    result = remove(image)
+    result = remove(image, session=_get_rembg_session())
     
     # Ensure RGBA
     return result.convert("RGBA")
@@ -80,12 +197,11 @@ def has_transparency(image: Image.Image) -> bool:
     if image.mode != "RGBA":
         return False
     
-    # Check alpha channel
-    alpha = image.split()[-1]
-    extrema = alpha.getextrema()
+    # Per-band extrema in a single C pass, without splitting out band images
+    alpha_min, _ = image.getextrema()[3]
     
     # If min alpha < 255, there's some transparency
-    return extrema[0] < 250
+    return alpha_min < 250
 
 
 def calculate_product_size(
@@ -131,7 +247,47 @@ def resize_product_image(
     scale = target_max_size / max_dim
     new_size = (int(width * scale), int(height * scale))
     
-    return image.resize(new_size, Image.Resampling.LANCZOS)
+    # Large catalog shots (e.g. 4000px -> 600px) are box-reduced first so the
+    # Lanczos pass runs on a much smaller intermediate
+    return image.resize(
+        new_size,
+        Image.Resampling.LANCZOS,
+        reducing_gap=RESIZE_REDUCING_GAP,
+    )
+
+
+# Product anchoring per canonical position:
+# (horizontal align, horizontal padding, vertical align, vertical padding),
+# padding as a fraction of the zone dimension
+POSITION_TABLE: dict[str, tuple[str, float, str, float]] = {
+    "center": ("center", 0.0, "center", 0.0),
+    "left": ("start", 0.15, "center", 0.0),
+    "right": ("end", 0.1, "center", 0.0),
+    "bottom": ("center", 0.0, "end", 0.1),
+    "top": ("center", 0.0, "start", 0.1),
+}
+
+
+@lru_cache(maxsize=256)
+def _position_key(position_directive: str) -> str:
+    """Map a free-form position directive (e.g. 'left-third') to a POSITION_TABLE key."""
+    position = position_directive.lower().replace("-", "_").replace(" ", "_")
+    
+    if "center" in position and "bottom" not in position and "top" not in position:
+        return "center"
+    for key in ("left", "right", "bottom", "top"):
+        if key in position:
+            return key
+    return "center"
+
+
+def _align_offset(zone_start: int, zone_len: int, item_len: int, align: str, pad: float) -> int:
+    """Offset of an item aligned within a zone along one axis."""
+    if align == "start":
+        return zone_start + int(zone_len * pad)
+    if align == "end":
+        return zone_start + zone_len - item_len - int(zone_len * pad)
+    return zone_start + zone_len // 2 - item_len // 2
 
 
 def calculate_product_position(
@@ -160,39 +316,9 @@ def calculate_product_position(
     zone_w = zone_x2 - zone_x1
     zone_h = zone_y2 - zone_y1
     
-    # Parse position directive
-    position = position_directive.lower().replace("-", "_").replace(" ", "_")
-    
-    # Calculate center position within zone
-    zone_center_x = zone_x1 + zone_w // 2
-    zone_center_y = zone_y1 + zone_h // 2
-    
-    if "center" in position and "bottom" not in position and "top" not in position:
-        # Pure center
-        x = zone_center_x - prod_w // 2
-        y = zone_center_y - prod_h // 2
-    elif "left" in position:
-        # Left-aligned within zone
-        x = zone_x1 + int(zone_w * 0.15)
-        y = zone_center_y - prod_h // 2
-    elif "right" in position:
-        # Right-aligned within zone
-        x = zone_x2 - prod_w - int(zone_w * 0.1)
-        y = zone_center_y - prod_h // 2
-    elif "bottom" in position:
-        x = zone_center_x - prod_w // 2
-        y = zone_y2 - prod_h - int(zone_h * 0.1)
-        if "right" in position:
-            x = zone_x2 - prod_w - int(zone_w * 0.1)
-        elif "left" in position:
-            x = zone_x1 + int(zone_w * 0.1)
-    elif "top" in position:
-        x = zone_center_x - prod_w // 2
-        y = zone_y1 + int(zone_h * 0.1)
-    else:
-        # Default: center in zone
-        x = zone_center_x - prod_w // 2
-        y = zone_center_y - prod_h // 2
+    h_align, h_pad, v_align, v_pad = POSITION_TABLE[_position_key(position_directive)]
+    x = _align_offset(zone_x1, zone_w, prod_w, h_align, h_pad)
+    y = _align_offset(zone_y1, zone_h, prod_h, v_align, v_pad)
     
     # Clamp to canvas bounds
     x = max(0, min(x, canvas_w - prod_w))
@@ -224,24 +350,22 @@ def apply_drop_shadow(
     new_width = image.width + shadow_extend * 2
     new_height = image.height + shadow_extend * 2
     
-    # Create shadow layer
-    shadow = Image.new("RGBA", (new_width, new_height), (0, 0, 0, 0))
-    
-    # Create shadow shape from alpha channel
-    if image.mode == "RGBA":
-        alpha = image.split()[-1]
-        shadow_shape = Image.new("RGBA", image.size, shadow_color)
-        shadow_shape.putalpha(alpha)
-    else:
-        shadow_shape = Image.new("RGBA", image.size, shadow_color)
-    
-    # Paste shadow at offset position
+    # Only the alpha needs blurring (the shadow color is constant), so build
+    # and blur a single-band mask instead of a full RGBA layer
     shadow_x = shadow_extend + offset[0]
     shadow_y = shadow_extend + offset[1]
-    shadow.paste(shadow_shape, (shadow_x, shadow_y))
+    mask = Image.new("L", (new_width, new_height), 0)
+    if image.mode == "RGBA":
+        mask.paste(image.getchannel("A"), (shadow_x, shadow_y))
+    else:
+        mask.paste(
+            shadow_color[3],
+            (shadow_x, shadow_y, shadow_x + image.width, shadow_y + image.height),
+        )
+    mask = mask.filter(ImageFilter.GaussianBlur(blur_radius))
     
-    # Blur the shadow
-    shadow = shadow.filter(ImageFilter.GaussianBlur(blur_radius))
+    shadow = Image.new("RGBA", (new_width, new_height), shadow_color[:3] + (0,))
+    shadow.putalpha(mask)
     
     # Paste original image on top
     img_x = shadow_extend
@@ -271,28 +395,30 @@ def apply_product_treatment(
         return apply_drop_shadow(image)
     
     if "reflection" in treatment_lower or "surface" in treatment_lower:
-        # Simple reflection: flip vertically, fade, composite below
-        reflection = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-        # Create fade gradient for reflection
-        gradient = Image.linear_gradient("L").rotate(180)
-        gradient = gradient.resize(reflection.size)
-        # Apply fade to alpha
-        if reflection.mode == "RGBA":
-            r, g, b, a = reflection.split()
-            a = Image.blend(a, gradient.convert("L"), 0.7)
-            reflection = Image.merge("RGBA", (r, g, b, a))
+        # Simple reflection: flip vertically, fade, composite below.
+        # Only the top 40% of the flipped image is kept, so crop before fading.
+        reflection_height = int(image.height * 0.4)
+        reflection = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM).crop(
+            (0, 0, image.width, reflection_height)
+        )
+        if reflection.mode == "RGBA" and reflection_height > 0:
+            # Fade gradient for reflection: rows are constant, so build a single
+            # column at full image height, keep the rows we use and widen it
+            gradient = Image.linear_gradient("L").rotate(180)
+            gradient = gradient.resize((1, image.height)).crop((0, 0, 1, reflection_height))
+            gradient = gradient.resize(reflection.size, Image.Resampling.NEAREST)
+            # Apply fade to alpha
+            reflection.putalpha(Image.blend(reflection.getchannel("A"), gradient, 0.7))
         
         # Create canvas for product + reflection
         total_height = int(image.height * 1.4)
         result = Image.new("RGBA", (image.width, total_height), (0, 0, 0, 0))
         result.paste(image, (0, 0), image if image.mode == "RGBA" else None)
         # Paste faded reflection below (cropped to 40% height)
-        reflection_height = int(image.height * 0.4)
-        reflection_cropped = reflection.crop((0, 0, reflection.width, reflection_height))
         result.paste(
-            reflection_cropped, 
+            reflection, 
             (0, image.height), 
-            reflection_cropped if reflection_cropped.mode == "RGBA" else None
+            reflection if reflection.mode == "RGBA" else None
         )
         return result
     
@@ -306,27 +432,31 @@ async def place_product(
     placement: ProductPlacement,
     zone: LayoutZone,
     remove_bg: bool = True,
+    product_image: Image.Image | None = None,
 ) -> Image.Image:
     """
     Full product placement pipeline.
     
     Args:
-        canvas: Background canvas to place product on
+        canvas: RGBA background canvas to place product on
         product_source: URL or path to product image
         placement: ProductPlacement with position, size, treatment
         zone: LayoutZone defining where product can be placed
         remove_bg: Whether to remove background (default True)
+        product_image: Already-loaded product image; skips fetching product_source
         
     Returns:
-        Canvas with product composited
+        The same canvas, with product composited in place
     """
     # Load product image
-    product = await load_product_image(product_source)
+    product = product_image if product_image is not None else await load_product_image(product_source)
+    if product.mode != "RGBA":
+        product = product.convert("RGBA")
     logger.info(f"Loaded product image: {product.size}")
     
     # Remove background if needed
     if remove_bg and not has_transparency(product):
-        product = remove_background(product)
+        product = await asyncio.to_thread(remove_background, product)
         logger.info("Background removed from product image")
     
     # Calculate target size
@@ -335,7 +465,7 @@ async def place_product(
     logger.info(f"Resized product to: {product.size}")
     
     # Apply treatment (shadow, reflection, etc.)
-    product = apply_product_treatment(product, placement.treatment)
+    product = await asyncio.to_thread(apply_product_treatment, product, placement.treatment)
     logger.info(f"Applied treatment: {placement.treatment}")
     
     # Calculate position
@@ -347,8 +477,8 @@ async def place_product(
     )
     logger.info(f"Product position: {position}")
     
-    # Composite onto canvas
-    result = canvas.copy()
-    result.paste(product, position, product if product.mode == "RGBA" else None)
+    # Composite onto canvas in place (the compositor owns the canvas, so a
+    # defensive full-frame copy would only cost memory bandwidth)
+    canvas.alpha_composite(product, position)
     
-    return result
+    return canvas
@@ -5,6 +5,7 @@ Layout templates for ad composition.
 from src.composition.templates.layout_specs import (
     LayoutSpec,
     LayoutZone,
+    PixelRect,
     LAYOUT_ARCHETYPES,
     get_layout_spec,
 )
@@ -12,6 +13,7 @@ from src.composition.templates.layout_specs import (
 __all__ = [
     "LayoutSpec",
     "LayoutZone",
+    "PixelRect",
     "LAYOUT_ARCHETYPES",
     "get_layout_spec",
 ]
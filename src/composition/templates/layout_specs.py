@@ -4,11 +4,43 @@ Layout specifications for ad composition archetypes.
 Defines zones and positioning rules for each layout type.
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, fields
 from difflib import get_close_matches
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class PixelRect:
+    """A LayoutZone resolved to pixel coordinates for a specific canvas size."""
+    
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    w: int
+    h: int
+
+
+@lru_cache(maxsize=1024)
+def _zone_bounds(
+    x_start: float,
+    y_start: float,
+    x_end: float,
+    y_end: float,
+    width: int,
+    height: int,
+) -> tuple[int, int, int, int]:
+    """Pixel bounds for zone ratios on a canvas (cached per zone and canvas size)."""
+    return (
+        int(width * x_start),
+        int(height * y_start),
+        int(width * x_end),
+        int(height * y_end),
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class LayoutZone:
     """
     Defines a rectangular zone as percentages of the canvas.
@@ -28,12 +60,12 @@ class LayoutZone:
         Returns:
             Tuple of (x1, y1, x2, y2) in pixels.
         """
-        return (
-            int(width * self.x_start),
-            int(height * self.y_start),
-            int(width * self.x_end),
-            int(height * self.y_end),
-        )
+        return _zone_bounds(self.x_start, self.y_start, self.x_end, self.y_end, width, height)
+    
+    def to_pixels(self, width: int, height: int) -> PixelRect:
+        """Resolve zone to a PixelRect for a canvas of the given size."""
+        x1, y1, x2, y2 = self.get_bounds(width, height)
+        return PixelRect(x1, y1, x2, y2, x2 - x1, y2 - y1)
     
     def get_center(self, width: int, height: int) -> tuple[int, int]:
         """Get center point in pixels."""
@@ -67,6 +99,20 @@ class LayoutSpec:
     headline_font_ratio: float = 0.045   # Font size as ratio of canvas height
     body_font_ratio: float = 0.025       # Body font size ratio
     cta_font_ratio: float = 0.028        # CTA font size ratio
+    
+    def pixel_rects(self, width: int, height: int) -> dict[str, PixelRect]:
+        """
+        Resolve every zone to pixels once for a canvas size.
+        
+        Returns:
+            Mapping of zone field name (e.g. 'logo_zone') to PixelRect.
+        """
+        rects = {}
+        for field in fields(self):
+            zone = getattr(self, field.name)
+            if isinstance(zone, LayoutZone):
+                rects[field.name] = zone.to_pixels(width, height)
+        return rects
 
 
 # =============================================================================
@@ -139,11 +185,24 @@ LAYOUT_ARCHETYPES: dict[str, LayoutSpec] = {
 DEFAULT_LAYOUT = "Minimal Product Focus"
 
 
+def _normalize_archetype(name: str) -> str:
+    """Canonical lookup key: lowercase alphanumerics only."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+# Archetypes keyed by normalized name, so case/punctuation variants skip fuzzy matching
+_NORMALIZED_ARCHETYPES: dict[str, LayoutSpec] = {
+    _normalize_archetype(name): spec for name, spec in LAYOUT_ARCHETYPES.items()
+}
+
+
+@lru_cache(maxsize=256)
 def get_layout_spec(archetype: str) -> LayoutSpec:
     """
     Get layout specification for an archetype.
     
-    Uses fuzzy matching if exact name not found.
+    Tries an exact match, then a normalized match (case and punctuation
+    insensitive), and only then fuzzy matching. Results are cached per name.
     
     Args:
         archetype: Layout archetype name (e.g., "Hero Product with Stat Overlay")
@@ -158,6 +217,11 @@ def get_layout_spec(archetype: str) -> LayoutSpec:
     if archetype in LAYOUT_ARCHETYPES:
         return LAYOUT_ARCHETYPES[archetype]
     
+    # Normalized match (e.g. "problem-solution split")
+    normalized = _NORMALIZED_ARCHETYPES.get(_normalize_archetype(archetype))
+    if normalized is not None:
+        return normalized
+    
     # Fuzzy match
     archetype_names = list(LAYOUT_ARCHETYPES.keys())
     matches = get_close_matches(archetype, archetype_names, n=1, cutoff=0.4)
@@ -5,12 +5,13 @@ Handles font loading, text wrapping, and rendering of headlines, body copy, and
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, features
 
-from src.composition.templates.layout_specs import LayoutZone
+from src.composition.templates.layout_specs import LayoutZone, PixelRect
 
 logger = logging.getLogger(__name__)
 
@@ -35,25 +36,27 @@ FALLBACK_FONT_FILES = {
 TextAlign = Literal["left", "center", "right"]
 
 
-def load_font(
-    weight: Literal["regular", "bold", "semibold"] = "regular",
-    size: int = 24,
-) -> ImageFont.FreeTypeFont:
+def _zone_bounds(zone: LayoutZone | PixelRect, canvas: Image.Image) -> tuple[int, int, int, int]:
+    """Pixel bounds for a zone, using pre-resolved PixelRects as-is."""
+    if isinstance(zone, PixelRect):
+        return zone.x1, zone.y1, zone.x2, zone.y2
+    return zone.get_bounds(canvas.width, canvas.height)
+
+
+@lru_cache(maxsize=8)
+def _resolve_font_path(weight: str) -> str | None:
     """
-    Load font with fallback chain: DejaVu -> Inter -> System -> Default.
+    Walk the font fallback chain once per weight.
     
-    Args:
-        weight: Font weight ('regular', 'bold', 'semibold')
-        size: Font size in pixels
-        
     Returns:
-        PIL ImageFont
+        Path (or system font name) FreeType can load, or None for the default font
     """
     # Try primary fonts (DejaVu)
     font_file = FONT_DIR / FONT_FILES.get(weight, FONT_FILES["regular"])
     try:
         if font_file.exists():
-            return ImageFont.truetype(str(font_file), size)
+            ImageFont.truetype(str(font_file), 12)
+            return str(font_file)
     except Exception as e:
         logger.warning(f"Failed to load primary font {font_file}: {e}")
     
@@ -61,22 +64,114 @@ def load_font(
     fallback_file = FONT_DIR / FALLBACK_FONT_FILES.get(weight, FALLBACK_FONT_FILES["regular"])
     try:
         if fallback_file.exists():
-            return ImageFont.truetype(str(fallback_file), size)
+            ImageFont.truetype(str(fallback_file), 12)
+            return str(fallback_file)
     except Exception as e:
         logger.warning(f"Failed to load fallback font {fallback_file}: {e}")
     
     # Fallback: try system fonts
     for system_font in ["Arial.ttf", "arial.ttf", "DejaVuSans.ttf", "Helvetica.ttf"]:
         try:
-            return ImageFont.truetype(system_font, size)
+            ImageFont.truetype(system_font, 12)
+            return system_font
         except OSError:
             continue
     
+    return None
+
+
+@lru_cache(maxsize=64)
+def load_font(
+    weight: Literal["regular", "bold", "semibold"] = "regular",
+    size: int = 24,
+    complex_script: bool = False,
+) -> ImageFont.FreeTypeFont:
+    """
+    Load font with fallback chain: DejaVu -> Inter -> System -> Default.
+    
+    The fallback chain is resolved once per weight and fonts are cached per
+    (weight, size, complex_script); use load_font.cache_clear() to reset.
+    
+    Args:
+        weight: Font weight ('regular', 'bold', 'semibold')
+        size: Font size in pixels
+        complex_script: Use Raqm shaping (bidi/complex scripts) when available;
+            otherwise the faster basic layout engine is used
+        
+    Returns:
+        PIL ImageFont
+    """
+    font_path = _resolve_font_path(weight)
+    if font_path is not None:
+        layout_engine = (
+            ImageFont.Layout.RAQM
+            if complex_script and features.check("raqm")
+            else ImageFont.Layout.BASIC
+        )
+        return ImageFont.truetype(font_path, size, layout_engine=layout_engine)
+    
     # Ultimate fallback: default font (may be bitmap)
     logger.warning(f"Using default font (size may not apply correctly)")
     return ImageFont.load_default()
 
 
+@lru_cache(maxsize=4096)
+def _rasterize_text(
+    text: str,
+    font_path: str,
+    size: int,
+    layout_engine: ImageFont.Layout,
+) -> tuple[Image.Image, tuple[int, int]]:
+    """
+    Rasterize a text run to an L-mode coverage mask.
+    
+    Returns:
+        (mask, (dx, dy)) where dx/dy offset the mask from the draw position
+    """
+    font = ImageFont.truetype(font_path, size, layout_engine=layout_engine)
+    if "\n" in text:
+        # getbbox measures a single line; size multi-line runs the way
+        # ImageDraw.text lays them out (multiline_text, default spacing)
+        left, top, right, bottom = ImageDraw.Draw(Image.new("L", (1, 1))).multiline_textbbox(
+            (0, 0), text, font=font
+        )
+    else:
+        left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, (left, top)
+
+
+def draw_text(
+    draw: ImageDraw.ImageDraw,
+    position: tuple[int, int],
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    fill: str,
+) -> None:
+    """
+    Draw text like ImageDraw.text, reusing cached glyph rasterization.
+    
+    Repeated runs (CTAs, brand names, disclaimers) are shaped and rasterized
+    by FreeType once and then stamped as a mask.
+    
+    Args:
+        draw: ImageDraw object
+        position: (x, y) top-left position
+        text: Text to draw (embedded newlines are drawn as separate lines)
+        font: Font to use
+        fill: Text color (hex or name, optionally with alpha)
+    """
+    font_path = getattr(font, "path", None)
+    if not text or not isinstance(font_path, str):
+        # Bitmap/default fonts: nothing to key the cache on
+        draw.text(position, text, font=font, fill=fill)
+        return
+    
+    mask, (dx, dy) = _rasterize_text(text, font_path, font.size, font.layout_engine)
+    draw.bitmap((position[0] + dx, position[1] + dy), mask, fill=fill)
+
+
 def wrap_text(
     text: str,
     font: ImageFont.FreeTypeFont,
@@ -93,30 +188,76 @@ def wrap_text(
     Returns:
         List of text lines
     """
+    return [line for line, _, _ in _wrap_text_measured(text, font, max_width)]
+
+
+def _wrap_text_measured(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    max_width: int,
+) -> list[tuple[str, int, int]]:
+    """
+    Wrap text and measure each resulting line once.
+    
+    Returns:
+        List of (line, width, height) using the line's bbox
+    """
     if not text:
         return []
     
     words = text.split()
+    
+    # Fast path: short headlines and CTAs usually fit on one line
+    single_line = " ".join(words)
+    bbox = font.getbbox(single_line)
+    if bbox[2] - bbox[0] <= max_width:
+        return [(single_line, bbox[2] - bbox[0], bbox[3] - bbox[1])]
+    
     lines = []
     current_line = []
     
+    # Advance widths are cheap to sum per word; an exact bbox measurement of
+    # the candidate line is only needed when the running estimate lands
+    # within one em of max_width (bearings/kerning can't shift it further)
+    margin = getattr(font, "size", None) or float("inf")
+    space_width = font.getlength(" ")
+    current_width = 0.0
+    current_bbox = None  # Exact bbox of current_line, when already measured
+    
+    def flush():
+        line = " ".join(current_line)
+        bbox = current_bbox or font.getbbox(line)
+        lines.append((line, bbox[2] - bbox[0], bbox[3] - bbox[1]))
+    
     for word in words:
-        # Test if word fits on current line
-        test_line = " ".join(current_line + [word])
-        bbox = font.getbbox(test_line)
-        line_width = bbox[2] - bbox[0]
+        word_width = font.getlength(word)
+        estimate = current_width + space_width + word_width if current_line else word_width
+        
+        bbox = None
+        if estimate <= max_width - margin:
+            fits = True
+        elif estimate > max_width + margin:
+            fits = False
+        else:
+            # Test if word fits on current line
+            bbox = font.getbbox(" ".join(current_line + [word]))
+            fits = bbox[2] - bbox[0] <= max_width
         
-        if line_width <= max_width:
+        if fits:
             current_line.append(word)
+            current_width = estimate
+            current_bbox = bbox
         else:
             # Word doesn't fit, start new line
             if current_line:
-                lines.append(" ".join(current_line))
+                flush()
             current_line = [word]
+            current_width = word_width
+            current_bbox = None
     
     # Add remaining line
     if current_line:
-        lines.append(" ".join(current_line))
+        flush()
     
     return lines
 
@@ -189,7 +330,7 @@ def render_text_block(
     Returns:
         Total height of rendered text block
     """
-    lines = wrap_text(text, font, max_width)
+    lines = _wrap_text_measured(text, font, max_width)
     
     if not lines:
         return 0
@@ -197,10 +338,7 @@ def render_text_block(
     x, y = position
     total_height = 0
     
-    for i, line in enumerate(lines):
-        bbox = font.getbbox(line)
-        line_width = bbox[2] - bbox[0]
-        line_height = bbox[3] - bbox[1]
+    for line, line_width, line_height in lines:
         
         # Calculate x position based on alignment
         if align == "center":
@@ -214,15 +352,16 @@ def render_text_block(
         
         # Draw shadow first
         if shadow:
-            draw.text(
+            draw_text(
+                draw,
                 (line_x + shadow_offset[0], line_y + shadow_offset[1]),
                 line,
-                font=font,
-                fill=shadow_color,
+                font,
+                shadow_color,
             )
         
         # Draw text
-        draw.text((line_x, line_y), line, font=font, fill=color)
+        draw_text(draw, (line_x, line_y), line, font, color)
         
         total_height += line_height + line_spacing
     
@@ -232,10 +371,11 @@ def render_text_block(
 def render_headline(
     canvas: Image.Image,
     text: str,
-    zone: LayoutZone,
+    zone: LayoutZone | PixelRect,
     brand_color: str,
     font_size_ratio: float = 0.045,
     align: TextAlign = "left",
+    draw: ImageDraw.ImageDraw | None = None,
 ) -> tuple[Image.Image, int]:
     """
     Render headline text in specified zone.
@@ -243,23 +383,25 @@ def render_headline(
     Args:
         canvas: Canvas to draw on (modified in place)
         text: Headline text
-        zone: Layout zone for headline
+        zone: Layout zone for headline (or its PixelRect for this canvas)
         brand_color: Primary brand color (hex)
         font_size_ratio: Font size as ratio of canvas height
         align: Text alignment
+        draw: Existing ImageDraw for canvas to reuse (created if None)
         
     Returns:
         Tuple of (canvas, height_used)
     """
-    draw = ImageDraw.Draw(canvas)
+    if draw is None:
+        draw = ImageDraw.Draw(canvas)
     
     # Calculate zone bounds
-    x1, y1, x2, y2 = zone.get_bounds(canvas.width, canvas.height)
+    x1, y1, x2, y2 = _zone_bounds(zone, canvas)
     zone_width = x2 - x1
     
     # Calculate font size
     font_size = int(canvas.height * font_size_ratio)
-    font = load_font("bold", font_size)
+    font = load_font("bold", font_size, complex_script=not text.isascii())
     
     # Render text
     height = render_text_block(
@@ -280,11 +422,12 @@ def render_headline(
 def render_body(
     canvas: Image.Image,
     text: str,
-    zone: LayoutZone,
+    zone: LayoutZone | PixelRect,
     y_offset: int = 0,
     color: str = "#FFFFFF",
     font_size_ratio: float = 0.025,
     align: TextAlign = "left",
+    draw: ImageDraw.ImageDraw | None = None,
 ) -> tuple[Image.Image, int]:
     """
     Render body copy in specified zone.
@@ -292,22 +435,24 @@ def render_body(
     Args:
         canvas: Canvas to draw on
         text: Body copy text
-        zone: Layout zone for body
+        zone: Layout zone for body (or its PixelRect for this canvas)
         y_offset: Vertical offset from zone top (e.g., after headline)
         color: Text color
         font_size_ratio: Font size as ratio of canvas height
         align: Text alignment
+        draw: Existing ImageDraw for canvas to reuse (created if None)
         
     Returns:
         Tuple of (canvas, height_used)
     """
-    draw = ImageDraw.Draw(canvas)
+    if draw is None:
+        draw = ImageDraw.Draw(canvas)
     
-    x1, y1, x2, y2 = zone.get_bounds(canvas.width, canvas.height)
+    x1, y1, x2, y2 = _zone_bounds(zone, canvas)
     zone_width = x2 - x1
     
     font_size = int(canvas.height * font_size_ratio)
-    font = load_font("regular", font_size)
+    font = load_font("regular", font_size, complex_script=not text.isascii())
     
     height = render_text_block(
         draw,
@@ -327,10 +472,11 @@ def render_body(
 def render_cta_button(
     canvas: Image.Image,
     text: str,
-    zone: LayoutZone,
+    zone: LayoutZone | PixelRect,
     accent_color: str,
     text_color: str = "#FFFFFF",
     font_size_ratio: float = 0.028,
+    draw: ImageDraw.ImageDraw | None = None,
 ) -> Image.Image:
     """
     Render CTA as a button with rounded rectangle background.
@@ -338,20 +484,22 @@ def render_cta_button(
     Args:
         canvas: Canvas to draw on
         text: CTA text
-        zone: Layout zone for CTA
+        zone: Layout zone for CTA (or its PixelRect for this canvas)
         accent_color: Button background color
         text_color: Button text color
         font_size_ratio: Font size ratio
+        draw: Existing ImageDraw for canvas to reuse (created if None)
         
     Returns:
         Canvas with CTA button
     """
-    draw = ImageDraw.Draw(canvas)
+    if draw is None:
+        draw = ImageDraw.Draw(canvas)
     
-    x1, y1, x2, y2 = zone.get_bounds(canvas.width, canvas.height)
+    x1, y1, x2, y2 = _zone_bounds(zone, canvas)
     
     font_size = int(canvas.height * font_size_ratio)
-    font = load_font("semibold", font_size)
+    font = load_font("semibold", font_size, complex_script=not text.isascii())
     
     # Measure text
     bbox = font.getbbox(text)
@@ -372,29 +520,38 @@ def render_cta_button(
         button_x = x1
     button_y = y1
     
-    # Draw rounded rectangle
+    # Draw rounded rectangle (shape mask is cached per button size)
     corner_radius = int(button_height * 0.3)
-    draw.rounded_rectangle(
-        [button_x, button_y, button_x + button_width, button_y + button_height],
-        radius=corner_radius,
+    draw.bitmap(
+        (button_x, button_y),
+        _button_mask(button_width, button_height, corner_radius),
         fill=accent_color,
     )
     
     # Draw text centered in button
     text_x = button_x + padding_x
     text_y = button_y + padding_y
-    draw.text((text_x, text_y), text, font=font, fill=text_color)
+    draw_text(draw, (text_x, text_y), text, font, text_color)
     
     return canvas
 
 
+@lru_cache(maxsize=32)
+def _button_mask(width: int, height: int, radius: int) -> Image.Image:
+    """Rounded-rectangle button shape as an L mask, matching draw.rounded_rectangle."""
+    mask = Image.new("L", (width + 1, height + 1), 0)
+    ImageDraw.Draw(mask).rounded_rectangle([0, 0, width, height], radius=radius, fill=255)
+    return mask
+
+
 def render_subheadline(
     canvas: Image.Image,
     text: str,
-    zone: LayoutZone,
+    zone: LayoutZone | PixelRect,
     y_offset: int = 0,
     color: str = "#CCCCCC",
     font_size_ratio: float = 0.030,
+    draw: ImageDraw.ImageDraw | None = None,
 ) -> tuple[Image.Image, int]:
     """
     Render subheadline (smaller than headline, above body).
@@ -402,21 +559,23 @@ def render_subheadline(
     Args:
         canvas: Canvas to draw on
         text: Subheadline text
-        zone: Layout zone
+        zone: Layout zone (or its PixelRect for this canvas)
         y_offset: Vertical offset
         color: Text color
         font_size_ratio: Font size ratio
+        draw: Existing ImageDraw for canvas to reuse (created if None)
         
     Returns:
         Tuple of (canvas, height_used)
     """
-    draw = ImageDraw.Draw(canvas)
+    if draw is None:
+        draw = ImageDraw.Draw(canvas)
     
-    x1, y1, x2, y2 = zone.get_bounds(canvas.width, canvas.height)
+    x1, y1, x2, y2 = _zone_bounds(zone, canvas)
     zone_width = x2 - x1
     
     font_size = int(canvas.height * font_size_ratio)
-    font = load_font("semibold", font_size)
+    font = load_font("semibold", font_size, complex_script=not text.isascii())
     
     height = render_text_block(
         draw,
@@ -437,6 +596,7 @@ def render_disclaimer(
     position: tuple[int, int] = None,
     color: str = "#999999",
     font_size: int = 12,
+    draw: ImageDraw.ImageDraw | None = None,
 ) -> Image.Image:
     """
     Render legal disclaimer text (small, at bottom).
@@ -447,12 +607,14 @@ def render_disclaimer(
         position: (x, y) position (default: bottom-center)
         color: Text color
         font_size: Font size in pixels
+        draw: Existing ImageDraw for canvas to reuse (created if None)
         
     Returns:
         Canvas with disclaimer
     """
-    draw = ImageDraw.Draw(canvas)
-    font = load_font("regular", font_size)
+    if draw is None:
+        draw = ImageDraw.Draw(canvas)
+    font = load_font("regular", font_size, complex_script=not text.isascii())
     
     bbox = font.getbbox(text)
     text_width = bbox[2] - bbox[0]
@@ -464,6 +626,6 @@ def render_disclaimer(
         y = canvas.height - text_height - 10
         position = (x, y)
     
-    draw.text(position, text, font=font, fill=color)
+    draw_text(draw, position, text, font, color)
     
     return canvas
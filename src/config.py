@@ -41,10 +41,15 @@ class Settings(BaseSettings):
     output_dir: Path = Path("output")
     assets_dir: Path = Path("assets")
     data_dir: Path = Path("data")
+    cache_dir: Path = Path(".cache")  # Fetched images and background-removal results
 
     # === Pipeline Settings ===
     max_icps: int = 4  # Maximum ICPs from segmentation
     llm_rate_limit_rpm: float = 5.0  # Requests per minute (0 = disabled)
+    rembg_model: str = "u2netp"  # Background removal model (u2netp is ~4x smaller than u2net)
+    png_compress_level: int = 1  # zlib level for final ads (0-9; 1 = fastest encode)
+    graph_cache_ttl: int = 0  # Seconds to reuse LLM stage results for identical inputs (0 = off)
+    remote_image_cache_ttl: int = 86400  # Seconds before a cached product URL is fetched again (0 = off)
 
     # === Debug Settings ===
     debug: bool = False
@@ -61,5 +66,13 @@ def get_settings() -> Settings:
     return Settings()
 
 
-# Convenience function to access settings
-settings = get_settings()
+def __getattr__(name: str):
+    """
+    Lazily expose `settings` for `from src.config import settings`.
+    
+    Defers .env/environment parsing until settings are first used instead of
+    at import time (PEP 562).
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,18 +7,24 @@ workflow with parallel ICP processing support via the Send API.
 Workflow Structure:
     START → Segmentation → [Fan-out per ICP] → Process ICP → END
     
-    Where Process ICP runs: Strategy → Concept → Copy → Design → Composition
+    Where Process ICP runs: Strategy → Concept → (Copy ∥ Design) → Composition
     for each ICP in parallel.
 """
 
 import asyncio
+import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.graph import END, START, StateGraph
-from langgraph.types import Send
+from langgraph.types import CachePolicy, Send
+from pydantic import BaseModel
 
 from agents.common.agent_utils import create_error, model_to_dict
 from agents.concept.agent import run_concept_for_icp
@@ -26,14 +32,81 @@ from agents.copy.agent import run_copy_for_icp
 from agents.design.agent import generate_scene_for_icp
 from agents.segmentation.agent import run_segmentation_agent
 from agents.strategy.agent import run_strategy_for_icp
-from src.composition import CompositionInput, Compositor
+from src.composition import CompositionInput, Compositor, warm_caches
 from src.config import get_settings
 from src.models import ICP, ErrorLog, ImageAsset
 from src.state import GraphState
+from src.utils.image_utils import close_http_client
 
 
 logger = logging.getLogger(__name__)
 
+# State keys a process_icp branch needs from the parent graph state
+ICP_BRANCH_INPUT_KEYS = (
+    "product",
+    "store_brand",
+    "product_brand",
+    "brand_strategy",
+    "channel",
+    "store_context",
+    "run_id",
+    "created_at",
+)
+
+
+# Per-run identifiers left out of node cache keys so identical inputs hit
+# across runs
+NODE_CACHE_IGNORED_KEYS = frozenset({"run_id", "created_at"})
+
+# Strategy/Concept/Copy results reused when settings.graph_cache_ttl > 0:
+# key -> (expiry on the monotonic clock, result)
+_stage_cache: dict[bytes, tuple[float, object]] = {}
+_stage_cache_lock = threading.Lock()
+
+# Canvas sizes whose composition caches have already been warmed
+_warmed_sizes: set[tuple[int, int]] = set()
+_warm_lock = threading.Lock()
+
+
+def _start_cache_warmup(state: GraphState) -> None:
+    """Warm composition caches for this run's canvas on a daemon thread."""
+    channel = state.get("channel")
+    if channel is None:
+        return
+    size = (channel.dimensions.width, channel.dimensions.height)
+    with _warm_lock:
+        if size in _warmed_sizes:
+            return
+        _warmed_sizes.add(size)
+    threading.Thread(target=warm_caches, args=size, name="cache-warmup", daemon=True).start()
+
+
+def _cached_stage(stage: str, func, state: GraphState, *args):
+    """
+    Run an LLM stage, reusing its result for identical inputs within the TTL.
+    
+    Only side-effect-free stages (Strategy, Concept, Copy) go through here;
+    Design and Composition write files for the current run and always run.
+    The key ignores run_id/created_at, like the segmentation node cache.
+    """
+    ttl = get_settings().graph_cache_ttl
+    if ttl <= 0:
+        return func(state, *args)
+    
+    key = stage.encode() + _node_cache_key({**state, "_args": args})
+    now = time.monotonic()
+    with _stage_cache_lock:
+        hit = _stage_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    
+    result = func(state, *args)
+    with _stage_cache_lock:
+        for expired in [k for k, (expiry, _) in _stage_cache.items() if expiry <= now]:
+            del _stage_cache[expired]
+        _stage_cache[key] = (now + ttl, result)
+    return result
+
 
 # =============================================================================
 # NODE FUNCTIONS
@@ -55,6 +128,9 @@ def segmentation_node(state: GraphState) -> dict:
     start_time = time.time()
     logger.info("[Segmentation] Starting segmentation...")
     
+    # Fonts and layout geometry load while the segmentation LLM call runs
+    _start_cache_warmup(state)
+    
     try:
         result = run_segmentation_agent(state)
         elapsed = time.time() - start_time
@@ -85,8 +161,9 @@ def process_icp_node(state: GraphState) -> dict:
     """
     LangGraph node that processes a single ICP through all stages.
     
-    Runs Strategy → Concept → Copy → Design → Composition sequentially
-    for the ICP specified in state['current_icp_id'].
+    Runs Strategy → Concept → (Copy ∥ Design) → Composition for the ICP
+    specified in state['current_icp_id']. Copy and Design only share the
+    concept as input, so they run concurrently.
     
     This node is invoked via Send() for each ICP, enabling parallel
     processing of different ICPs.
@@ -136,7 +213,7 @@ def process_icp_node(state: GraphState) -> dict:
     # --- Stage 1: Strategy ---
     try:
         logger.info(f"[ProcessICP:{icp_id}] Running Strategy Agent...")
-        strategy = run_strategy_for_icp(state, icp)
+        strategy = _cached_stage("strategy", run_strategy_for_icp, state, icp)
         results["strategies"] = {icp_id: strategy}
         logger.info(f"[ProcessICP:{icp_id}] Strategy complete: {strategy.key_benefit[:50]}...")
     except Exception as e:
@@ -149,7 +226,7 @@ def process_icp_node(state: GraphState) -> dict:
     # --- Stage 2: Concept ---
     try:
         logger.info(f"[ProcessICP:{icp_id}] Running Concept Agent...")
-        concept = run_concept_for_icp(state, icp, strategy)
+        concept = _cached_stage("concept", run_concept_for_icp, state, icp, strategy)
         results["concepts"] = {icp_id: concept}
         logger.info(f"[ProcessICP:{icp_id}] Concept complete: {concept.big_idea[:50]}...")
     except Exception as e:
@@ -158,27 +235,36 @@ def process_icp_node(state: GraphState) -> dict:
         results["errors"] = errors
         return results
     
-    # --- Stage 3: Copy ---
+    # --- Stages 3 & 4: Copy and Design (concurrent) ---
+    # Copy needs strategy + concept; Design only needs concept. Running them
+    # side by side hides the slower one (usually Design's image generation).
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"icp-{icp_id}") as executor:
+        logger.info(f"[ProcessICP:{icp_id}] Running Copy and Design Agents...")
+        copy_future = executor.submit(
+            _cached_stage, "copy", run_copy_for_icp, state, icp, strategy, concept
+        )
+        design_future = executor.submit(generate_scene_for_icp, state, icp, concept)
+    
+    ad_copy = None
     try:
-        logger.info(f"[ProcessICP:{icp_id}] Running Copy Agent...")
-        ad_copy = run_copy_for_icp(state, icp, strategy, concept)
+        ad_copy = copy_future.result()
         results["copy"] = {icp_id: ad_copy}
         logger.info(f"[ProcessICP:{icp_id}] Copy complete: {ad_copy.headline}")
     except Exception as e:
         logger.error(f"[ProcessICP:{icp_id}] Copy failed: {e}")
         errors.append(ErrorLog(agent_name="copy", icp_id=icp_id, error_message=str(e)))
-        results["errors"] = errors
-        return results
     
-    # --- Stage 4: Design ---
+    scene = None
     try:
-        logger.info(f"[ProcessICP:{icp_id}] Running Design Agent...")
-        scene = generate_scene_for_icp(state, icp, concept)
+        scene = design_future.result()
         results["scenes"] = {icp_id: scene}
         logger.info(f"[ProcessICP:{icp_id}] Design complete: {scene.path}")
     except Exception as e:
         logger.error(f"[ProcessICP:{icp_id}] Design failed: {e}")
         errors.append(ErrorLog(agent_name="design", icp_id=icp_id, error_message=str(e)))
+    
+    # Composition needs both
+    if ad_copy is None or scene is None:
         results["errors"] = errors
         return results
     
@@ -227,9 +313,8 @@ def _run_composition(
     settings = get_settings()
     product = state["product"]
     
-    # Determine output path
+    # Determine output path (the compositor creates the directory on first save)
     output_dir = Path(settings.output_dir) / "ads"
-    output_dir.mkdir(parents=True, exist_ok=True)
     run_id = state.get("run_id", "unknown")
     output_path = output_dir / f"ad_{icp_id}_{run_id[:8]}.png"
     
@@ -242,6 +327,7 @@ def _run_composition(
     # Build composition input
     composition_input = CompositionInput(
         background_path=scene.path,
+        background_image=scene.image,
         product_image_source=product_image,
         ad_copy=ad_copy,
         concept=concept,
@@ -251,16 +337,25 @@ def _run_composition(
         channel=state["channel"],
         output_path=str(output_path),
         output_format="PNG",
+        png_compress_level=settings.png_compress_level,
         remove_product_bg=True,
     )
     
     # Run compositor (async method called synchronously)
     compositor = Compositor()
-    result = asyncio.run(compositor.compose(composition_input))
+    result = asyncio.run(_compose_and_close(compositor, composition_input))
     
     return result
 
 
+async def _compose_and_close(compositor: Compositor, composition_input: CompositionInput) -> ImageAsset:
+    """Compose one ad, then close the HTTP client pooled on this asyncio.run loop."""
+    try:
+        return await compositor.compose(composition_input)
+    finally:
+        await close_http_client()
+
+
 # =============================================================================
 # ROUTING FUNCTIONS
 # =============================================================================
@@ -294,12 +389,16 @@ def route_to_icps(state: GraphState) -> list[Send]:
     
     logger.info(f"[Router] Processing {len(icps)} ICPs")
     
-    # Create a Send for each ICP
+    # Create a Send for each ICP. A Send payload *is* the branch's input state
+    # (it is not merged with the parent), so pass the campaign inputs the
+    # per-ICP agents read plus this ICP only - not other branches' outputs.
+    inputs = {key: state[key] for key in ICP_BRANCH_INPUT_KEYS if key in state}
     return [
         Send(
             "process_icp",
             {
-                **state,
+                **inputs,
+                "icps": [icp],
                 "current_icp_id": icp.icp_id,
             }
         )
@@ -311,6 +410,25 @@ def route_to_icps(state: GraphState) -> list[Send]:
 # GRAPH BUILDER
 # =============================================================================
 
+def _cache_json_default(value):
+    """JSON fallback for cache keys: models by their field values, anything else by str()."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def _node_cache_key(state: dict) -> bytes:
+    """
+    Cache key for a node's input state, ignoring per-run identifiers.
+    
+    Models are keyed by their JSON field values rather than pickled, so
+    copies that went through LangGraph's cache serializer (e.g. ICPs from
+    a cached segmentation) still produce the same key.
+    """
+    inputs = {k: v for k, v in state.items() if k not in NODE_CACHE_IGNORED_KEYS}
+    return json.dumps(inputs, sort_keys=True, default=_cache_json_default).encode()
+
+
 def build_graph() -> StateGraph:
     """
     Build and compile the LangGraph workflow for ad generation.
@@ -323,16 +441,31 @@ def build_graph() -> StateGraph:
     Each ICP is processed through Strategy→Concept→Copy→Design→Composition
     within the process_icp node.
     
+    With settings.graph_cache_ttl > 0 the segmentation node is cached in
+    memory, keyed on its inputs minus run_id/created_at, and process_icp
+    reuses Strategy/Concept/Copy results the same way (_cached_stage).
+    process_icp itself is never cached: Design and Composition write this
+    run's scene and ad files.
+    
     Returns:
         Compiled StateGraph ready for execution
     """
     logger.info("Building ad generation graph...")
     
+    settings = get_settings()
+    
+    # Optional node cache: identical inputs reuse earlier LLM results
+    cache_policy = None
+    cache = None
+    if settings.graph_cache_ttl > 0:
+        cache_policy = CachePolicy(key_func=_node_cache_key, ttl=settings.graph_cache_ttl)
+        cache = InMemoryCache()
+    
     # Create graph with our state schema
     builder = StateGraph(GraphState)
     
     # Add nodes
-    builder.add_node("segmentation", segmentation_node)
+    builder.add_node("segmentation", segmentation_node, cache_policy=cache_policy)
     builder.add_node("process_icp", process_icp_node)
     
     # Add edges
@@ -350,18 +483,20 @@ def build_graph() -> StateGraph:
     builder.add_edge("process_icp", END)
     
     # Compile the graph
-    graph = builder.compile()
+    graph = builder.compile(cache=cache)
     
     logger.info("Graph compiled successfully")
     
     return graph
 
 
+@lru_cache(maxsize=1)
 def get_graph():
     """
     Get or create the compiled graph instance.
     
-    This is a convenience function for use by the runner.
+    This is a convenience function for use by the runner. The graph is
+    compiled once per process; use get_graph.cache_clear() to rebuild.
     
     Returns:
         Compiled StateGraph
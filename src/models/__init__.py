@@ -4,22 +4,36 @@ Sartor Ad Engine - Pydantic Models.
 Central exports for all data models used in the ad generation pipeline.
 """
 
-from .assets import ErrorLog, ImageAsset
-from .brand import BrandContext, BrandStrategyType, ColorPalette
-from .channel import ChannelContext, Dimensions, TextConstraints
-from .concept import CreativeConcept, ProductPlacement, ProductSize
-from .copy import AdCopy
-from .icp import (
-    ICP,
-    AppealType,
-    BehavioralTriggers,
-    CommunicationPreferences,
-    Demographic,
-    Psychographics,
-)
-from .product import Price, ProductData
-from .store import PricePositioning, StoreContext
-from .strategy import StrategicBrief
+import importlib
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so importing one model only builds the
+# pydantic schemas of its own module.
+_LAZY_EXPORTS = {
+    "ErrorLog": "assets",
+    "ImageAsset": "assets",
+    "BrandContext": "brand",
+    "BrandStrategyType": "brand",
+    "ColorPalette": "brand",
+    "ChannelContext": "channel",
+    "Dimensions": "channel",
+    "TextConstraints": "channel",
+    "CreativeConcept": "concept",
+    "ProductPlacement": "concept",
+    "ProductSize": "concept",
+    "AdCopy": "copy",
+    "ICP": "icp",
+    "AppealType": "icp",
+    "BehavioralTriggers": "icp",
+    "CommunicationPreferences": "icp",
+    "Demographic": "icp",
+    "Psychographics": "icp",
+    "Price": "product",
+    "ProductData": "product",
+    "PricePositioning": "store",
+    "StoreContext": "store",
+    "StrategicBrief": "strategy",
+}
 
 __all__ = [
     # Product
@@ -55,3 +69,17 @@ __all__ = [
     "ImageAsset",
     "ErrorLog",
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access and cache the export."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
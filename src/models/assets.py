@@ -6,7 +6,8 @@ Defines ImageAsset for Design Agent output and ErrorLog for error tracking.
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from PIL import Image
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ImageAsset(BaseModel):
@@ -17,6 +18,8 @@ class ImageAsset(BaseModel):
     and Composition Module output (final ads).
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     path: str = Field(..., description="Local file path")
     url: str | None = Field(None, description="Remote URL if applicable")
     prompt_used: str | None = Field(
@@ -25,6 +28,12 @@ class ImageAsset(BaseModel):
     )
     width: int = Field(..., gt=0)
     height: int = Field(..., gt=0)
+    image: Image.Image | None = Field(
+        None,
+        exclude=True,
+        repr=False,
+        description="Decoded pixels kept in memory for in-process handoff (not serialized)",
+    )
 
 
 class ErrorLog(BaseModel):
@@ -34,6 +43,8 @@ class ErrorLog(BaseModel):
     Stored in AdCreationState.errors for debugging and recovery.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     agent_name: str = Field(..., description="Name of the agent that failed")
     icp_id: str | None = Field(
         None, 
@@ -6,7 +6,7 @@ Defines BrandContext (reusable for store and product brands) and BrandStrategy.
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Brand strategy type - determines which brand identity dominates the ad
@@ -16,6 +16,8 @@ BrandStrategyType = Literal["store_dominant", "product_dominant", "co_branded"]
 class ColorPalette(BaseModel):
     """Brand color scheme with hex codes."""
 
+    model_config = ConfigDict(frozen=True)
+
     primary: str = Field(..., description="Primary brand color (hex)")
     secondary: str | None = Field(None, description="Secondary color (hex)")
     accent: str | None = Field(None, description="Accent color (hex)")
@@ -35,7 +37,7 @@ class BrandContext(BaseModel):
         ..., 
         description="Description of brand personality (e.g., 'Premium, minimalist, tech-forward')"
     )
-    tone_keywords: list[str] = Field(
+    tone_keywords: tuple[str, ...] = Field(
         ..., 
         description="Adjectives defining tone (e.g., ['confident', 'aspirational', 'warm'])"
     )
@@ -4,12 +4,14 @@ Channel context models for Sartor Ad Engine.
 Defines the advertising channel/platform specifications.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Dimensions(BaseModel):
     """Image dimensions in pixels."""
 
+    model_config = ConfigDict(frozen=True)
+
     width: int = Field(..., gt=0)
     height: int = Field(..., gt=0)
 
@@ -17,6 +19,8 @@ class Dimensions(BaseModel):
 class TextConstraints(BaseModel):
     """Character limits for ad copy elements."""
 
+    model_config = ConfigDict(frozen=True)
+
     headline_max_chars: int = Field(..., gt=0)
     body_max_chars: int = Field(..., gt=0)
     cta_max_chars: int = Field(..., gt=0)
@@ -6,7 +6,7 @@ Defines the output schema for the Concept Agent.
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Product size in the ad composition
@@ -16,6 +16,8 @@ ProductSize = Literal["dominant", "balanced", "subtle"]
 class ProductPlacement(BaseModel):
     """Directives for how the product should be placed in the final ad."""
 
+    model_config = ConfigDict(frozen=True)
+
     position: str = Field(
         ..., 
         description="Position in frame (e.g., 'center', 'left-third', 'bottom-right')"
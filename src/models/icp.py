@@ -33,7 +33,7 @@ class Demographic(BaseModel):
 class Psychographics(BaseModel):
     """Psychological characteristics of the ICP."""
 
-    values: list[str] = Field(..., description="Core values")
+    values: tuple[str, ...] = Field(..., description="Core values")
     lifestyle: str = Field(..., description="Lifestyle description")
     aspirations: str = Field(..., description="Goals and aspirations")
 
@@ -41,9 +41,9 @@ class Psychographics(BaseModel):
 class BehavioralTriggers(BaseModel):
     """Purchase behavior patterns of the ICP."""
 
-    purchase_motivators: list[str] = Field(..., description="What drives purchase decisions")
-    objections: list[str] = Field(..., description="Common concerns or hesitations")
-    decision_factors: list[str] = Field(..., description="Key factors in final decision")
+    purchase_motivators: tuple[str, ...] = Field(..., description="What drives purchase decisions")
+    objections: tuple[str, ...] = Field(..., description="Common concerns or hesitations")
+    decision_factors: tuple[str, ...] = Field(..., description="Key factors in final decision")
 
 
 class CommunicationPreferences(BaseModel):
@@ -51,7 +51,7 @@ class CommunicationPreferences(BaseModel):
 
     tone: str = Field(..., description="Preferred communication tone")
     vocabulary_level: str = Field(..., description="e.g., 'Technical', 'Casual'")
-    responds_to: list[AppealType] = Field(
+    responds_to: tuple[AppealType, ...] = Field(
         ..., 
         description="Types of appeals that resonate"
     )
@@ -6,12 +6,14 @@ Defines the ProductData schema representing an eCommerce product catalog item.
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Price(BaseModel):
     """Product pricing information."""
 
+    model_config = ConfigDict(frozen=True)
+
     value: float
     currency: str = "USD"
     compare_at_price: float | None = None  # Original price for discounts
@@ -28,9 +30,9 @@ class ProductData(BaseModel):
     product_id: str = Field(..., description="Unique identifier (SKU)")
     name: str = Field(..., description="Product display name")
     description: str = Field(..., description="Full product description")
-    features: list[str] = Field(..., description="Key product features/specs")
-    benefits: list[str] = Field(..., description="Customer-facing benefits")
+    features: tuple[str, ...] = Field(..., description="Key product features/specs")
+    benefits: tuple[str, ...] = Field(..., description="Customer-facing benefits")
     price: Price
     category: str = Field(..., description="Product category/taxonomy")
-    images: list[str] = Field(..., description="Product image URLs")
+    images: tuple[str, ...] = Field(..., description="Product image URLs")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional attributes")
@@ -29,8 +29,8 @@ class StoreContext(BaseModel):
         None, 
         description="Market positioning: budget, mid-range, premium, or luxury"
     )
-    competitors: list[str] = Field(
-        default_factory=list, 
+    competitors: tuple[str, ...] = Field(
+        default=(), 
         description="Key competitor names"
     )
     store_statistics: dict[str, Any] | None = Field(
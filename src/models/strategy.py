@@ -40,7 +40,7 @@ class StrategicBrief(BaseModel):
         ..., 
         description="Specific tone for this ICP, aligned with brand voice"
     )
-    message_hierarchy: list[str] = Field(
+    message_hierarchy: tuple[str, ...] = Field(
         ..., 
         description="[primary message, secondary message, tertiary message]",
         min_length=1,
@@ -9,28 +9,29 @@ Usage:
     python -m src.runner --input data/samples/multi_brand_retailer.json --output-dir output/run_001
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import logging
 import sys
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-
-from src.config import get_settings
-from src.graph import build_graph
-from src.models import (
-    BrandContext,
-    ChannelContext,
-    ColorPalette,
-    Dimensions,
-    ProductData,
-    Price,
-    StoreContext,
-    TextConstraints,
-)
-from src.state import create_graph_state, GraphState
+from typing import TYPE_CHECKING, Any, Callable
+
+# Optional faster JSON codec - install with: pip install sartor-ad-engine[speedups]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Models, state and the LangGraph workflow are imported where they are first
+# needed, so `--help` and argument errors return without loading them.
+if TYPE_CHECKING:
+    from src.models import BrandContext, ChannelContext, ProductData, StoreContext
+    from src.state import GraphState
 
 
 # Configure logging
@@ -64,94 +65,88 @@ def load_product_input(file_path: str) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Input file not found: {file_path}")
     
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(path.read_bytes())
+    
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+# Fallbacks for keys the input JSON may omit, applied before validation
+_PRODUCT_DEFAULTS = {
+    "product_id": "",
+    "name": "",
+    "description": "",
+    "features": (),
+    "benefits": (),
+    "category": "",
+    "images": (),
+}
+_PRICE_DEFAULTS = {"value": 0}
+_BRAND_DEFAULTS = {
+    "brand_name": "",
+    "brand_voice": "",
+    "tone_keywords": (),
+    "visual_style": "",
+}
+_COLOR_PALETTE_DEFAULTS = {"primary": "#000000"}
+_CHANNEL_DEFAULTS = {"platform": "", "placement": ""}
+_DIMENSIONS_DEFAULTS = {"width": 1080, "height": 1080}
+_TEXT_CONSTRAINTS_DEFAULTS = {
+    "headline_max_chars": 40,
+    "body_max_chars": 125,
+    "cta_max_chars": 20,
+}
+_STORE_CONTEXT_DEFAULTS = {"price_positioning": "mid-range"}
+
+
 def parse_product_data(data: dict) -> ProductData:
     """Parse product data from input dict to Pydantic model."""
-    product = data["product"]
+    from src.models import ProductData
     
-    # Parse price
-    price_data = product.get("price", {})
-    price = Price(
-        value=price_data.get("value", 0),
-        currency=price_data.get("currency", "USD"),
-        compare_at_price=price_data.get("compare_at_price"),
-    )
-    
-    return ProductData(
-        product_id=product.get("product_id", ""),
-        name=product.get("name", ""),
-        description=product.get("description", ""),
-        features=product.get("features", []),
-        benefits=product.get("benefits", []),
-        price=price,
-        category=product.get("category", ""),
-        images=product.get("images", []),
-        metadata=product.get("metadata", {}),
-    )
+    product = data["product"]
+    return ProductData.model_validate({
+        **_PRODUCT_DEFAULTS,
+        **product,
+        "price": {**_PRICE_DEFAULTS, **product.get("price", {})},
+    })
 
 
 def parse_brand_context(data: dict) -> BrandContext:
     """Parse brand context from input dict to Pydantic model."""
-    # Parse color palette
-    palette_data = data.get("color_palette", {})
-    color_palette = ColorPalette(
-        primary=palette_data.get("primary", "#000000"),
-        secondary=palette_data.get("secondary"),
-        accent=palette_data.get("accent"),
-        background=palette_data.get("background"),
-    )
+    from src.models import BrandContext
     
-    return BrandContext(
-        brand_name=data.get("brand_name", ""),
-        brand_voice=data.get("brand_voice", ""),
-        tone_keywords=data.get("tone_keywords", []),
-        visual_style=data.get("visual_style", ""),
-        color_palette=color_palette,
-        logo_url=data.get("logo_url"),
-        tagline=data.get("tagline"),
-    )
+    return BrandContext.model_validate({
+        **_BRAND_DEFAULTS,
+        **data,
+        "color_palette": {**_COLOR_PALETTE_DEFAULTS, **data.get("color_palette", {})},
+    })
 
 
 def parse_channel_context(data: dict) -> ChannelContext:
     """Parse channel context from input dict to Pydantic model."""
-    # Parse dimensions
-    dimensions_data = data.get("dimensions", {})
-    dimensions = Dimensions(
-        width=dimensions_data.get("width", 1080),
-        height=dimensions_data.get("height", 1080),
-    )
-    
-    # Parse text constraints
-    constraints_data = data.get("text_constraints", {})
-    text_constraints = TextConstraints(
-        headline_max_chars=constraints_data.get("headline_max_chars", 40),
-        body_max_chars=constraints_data.get("body_max_chars", 125),
-        cta_max_chars=constraints_data.get("cta_max_chars", 20),
-    )
-    
-    return ChannelContext(
-        platform=data.get("platform", ""),
-        placement=data.get("placement", ""),
-        dimensions=dimensions,
-        text_constraints=text_constraints,
-        audience_context=data.get("audience_context"),
-    )
+    from src.models import ChannelContext
+    
+    return ChannelContext.model_validate({
+        **_CHANNEL_DEFAULTS,
+        **data,
+        "dimensions": {**_DIMENSIONS_DEFAULTS, **data.get("dimensions", {})},
+        "text_constraints": {
+            **_TEXT_CONSTRAINTS_DEFAULTS,
+            **data.get("text_constraints", {}),
+        },
+    })
 
 
 def parse_store_context(data: dict | None) -> StoreContext | None:
     """Parse store context from input dict to Pydantic model."""
+    from src.models import StoreContext
+    
     if not data:
         return None
     
-    return StoreContext(
-        customer_summary=data.get("customer_summary"),
-        price_positioning=data.get("price_positioning", "mid-range"),
-        competitors=data.get("competitors", []),
-        store_statistics=data.get("store_statistics"),
-    )
+    return StoreContext.model_validate({**_STORE_CONTEXT_DEFAULTS, **data})
 
 
 def parse_full_input(data: dict) -> GraphState:
@@ -164,6 +159,8 @@ def parse_full_input(data: dict) -> GraphState:
     Returns:
         Initialized GraphState ready for pipeline execution
     """
+    from src.state import create_graph_state
+    
     # Parse all components
     product = parse_product_data(data)
     store_brand = parse_brand_context(data["store_brand"])
@@ -174,7 +171,8 @@ def parse_full_input(data: dict) -> GraphState:
     
     channel = parse_channel_context(data["channel"])
     store_context = parse_store_context(data.get("store_context"))
-    brand_strategy = data.get("brand_strategy", "store_dominant")
+    # Not validated by a model, so intern it like pydantic's Literal values
+    brand_strategy = sys.intern(data.get("brand_strategy", "store_dominant"))
     
     # Create state
     return create_graph_state(
@@ -191,6 +189,32 @@ def parse_full_input(data: dict) -> GraphState:
 # OUTPUT HANDLING
 # =============================================================================
 
+@dataclass(frozen=True, slots=True)
+class _RunResults:
+    """Per-stage results of a finished run, read from the graph state once."""
+    
+    icps: list
+    strategies: dict
+    concepts: dict
+    copies: dict
+    scenes: dict
+    final_ads: dict
+    errors: list
+
+
+def _run_results(state: GraphState) -> _RunResults:
+    """Collect the stage outputs of state, substituting empty containers."""
+    return _RunResults(
+        icps=state.get("icps") or [],
+        strategies=state.get("strategies") or {},
+        concepts=state.get("concepts") or {},
+        copies=state.get("copy") or {},
+        scenes=state.get("scenes") or {},
+        final_ads=state.get("final_ads") or {},
+        errors=state.get("errors") or [],
+    )
+
+
 def save_run_summary(state: GraphState, output_dir: Path, elapsed_time: float) -> Path:
     """
     Save a summary of the pipeline run to a JSON file.
@@ -203,6 +227,8 @@ def save_run_summary(state: GraphState, output_dir: Path, elapsed_time: float) -
     Returns:
         Path to the saved summary file
     """
+    results = _run_results(state)
+    
     summary = {
         "run_id": state.get("run_id", "unknown"),
         "timestamp": datetime.now().isoformat(),
@@ -210,20 +236,20 @@ def save_run_summary(state: GraphState, output_dir: Path, elapsed_time: float) -
         "product_name": state["product"].name,
         "store_brand": state["store_brand"].brand_name,
         "brand_strategy": state.get("brand_strategy", "store_dominant"),
-        "icps_generated": len(state.get("icps", [])),
-        "ads_generated": len(state.get("final_ads", {})),
-        "errors_count": len(state.get("errors", [])),
+        "icps_generated": len(results.icps),
+        "ads_generated": len(results.final_ads),
+        "errors_count": len(results.errors),
         "icps": [
             {
                 "icp_id": icp.icp_id,
                 "name": icp.name,
-                "has_strategy": icp.icp_id in state.get("strategies", {}),
-                "has_concept": icp.icp_id in state.get("concepts", {}),
-                "has_copy": icp.icp_id in state.get("copy", {}),
-                "has_scene": icp.icp_id in state.get("scenes", {}),
-                "has_final_ad": icp.icp_id in state.get("final_ads", {}),
+                "has_strategy": icp.icp_id in results.strategies,
+                "has_concept": icp.icp_id in results.concepts,
+                "has_copy": icp.icp_id in results.copies,
+                "has_scene": icp.icp_id in results.scenes,
+                "has_final_ad": icp.icp_id in results.final_ads,
             }
-            for icp in state.get("icps", [])
+            for icp in results.icps
         ],
         "final_ads": {
             icp_id: {
@@ -231,7 +257,7 @@ def save_run_summary(state: GraphState, output_dir: Path, elapsed_time: float) -
                 "width": asset.width,
                 "height": asset.height,
             }
-            for icp_id, asset in state.get("final_ads", {}).items()
+            for icp_id, asset in results.final_ads.items()
         },
         "errors": [
             {
@@ -239,7 +265,7 @@ def save_run_summary(state: GraphState, output_dir: Path, elapsed_time: float) -
                 "icp_id": err.icp_id,
                 "message": err.error_message,
             }
-            for err in state.get("errors", [])
+            for err in results.errors
         ],
     }
     
@@ -248,8 +274,11 @@ def save_run_summary(state: GraphState, output_dir: Path, elapsed_time: float) -
     
     # Save summary
     summary_path = output_dir / f"run_summary_{state.get('run_id', 'unknown')[:8]}.json"
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    if orjson is not None:
+        summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
     
     return summary_path
 
@@ -266,9 +295,8 @@ def print_run_report(state: GraphState, elapsed_time: float) -> None:
     print(f"Brand Strategy: {state.get('brand_strategy', 'store_dominant')}")
     print(f"Elapsed Time:   {elapsed_time:.2f}s")
     
-    icps = state.get("icps", [])
-    final_ads = state.get("final_ads", {})
-    errors = state.get("errors", [])
+    results = _run_results(state)
+    icps, final_ads, errors = results.icps, results.final_ads, results.errors
     
     print(f"\n📊 RESULTS:")
     print(f"   ICPs Generated:  {len(icps)}")
@@ -317,6 +345,9 @@ def run_pipeline(
     Returns:
         Final GraphState after pipeline execution
     """
+    from src.config import get_settings
+    from src.graph import get_graph
+    
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
@@ -341,7 +372,7 @@ def run_pipeline(
     
     # Build and run graph
     logger.info("Building graph...")
-    graph = build_graph()
+    graph = get_graph()
     
     logger.info("Starting pipeline execution...")
     start_time = time.time()
@@ -366,6 +397,33 @@ def run_pipeline(
         raise
 
 
+# CLI exit policy: exception type -> (exit code, how to report it)
+_EXIT_POLICY: dict[type[BaseException], tuple[int, Callable[[BaseException], None]]] = {
+    FileNotFoundError: (1, lambda e: logger.error(str(e))),
+    json.JSONDecodeError: (1, lambda e: logger.error(f"Invalid JSON in input file: {e}")),
+    KeyboardInterrupt: (130, lambda e: logger.info("Pipeline interrupted by user")),
+}
+
+
+def _exit_code_for(error: BaseException) -> int:
+    """
+    Report a pipeline failure and return the CLI exit code for it.
+    
+    Looks up the most specific entry in _EXIT_POLICY along the exception's
+    MRO (so subclasses such as orjson.JSONDecodeError match); anything
+    unlisted is logged with its traceback and exits with 1.
+    """
+    for cls in type(error).__mro__:
+        policy = _EXIT_POLICY.get(cls)
+        if policy is not None:
+            exit_code, report = policy
+            report(error)
+            return exit_code
+    
+    logger.exception(f"Pipeline failed: {error}")
+    return 1
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -412,23 +470,10 @@ Examples:
             run_id=args.run_id,
             verbose=args.verbose,
         )
-        sys.exit(0)
-        
-    except FileNotFoundError as e:
-        logger.error(str(e))
-        sys.exit(1)
-        
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in input file: {e}")
-        sys.exit(1)
-        
-    except KeyboardInterrupt:
-        logger.info("Pipeline interrupted by user")
-        sys.exit(130)
-        
-    except Exception as e:
-        logger.exception(f"Pipeline failed: {e}")
-        sys.exit(1)
+    except (Exception, KeyboardInterrupt) as e:
+        sys.exit(_exit_code_for(e))
+    
+    sys.exit(0)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,10 @@ This module provides two state variants:
 - GraphState: Annotated TypedDict with reducers for parallel ICP processing
 """
 
+from __future__ import annotations
+
 import operator
+import uuid
 from datetime import datetime
 from typing import Annotated, TypedDict
 
@@ -39,6 +42,10 @@ def merge_dicts(a: dict, b: dict) -> dict:
     Used for parallel updates to dict-keyed fields (strategies, concepts, etc.).
     Later values (b) take precedence over earlier values (a).
     
+    Neither argument is mutated: LangGraph shares channel values between
+    channel copies and checkpoints, so an in-place update would leak into
+    them. An empty side is returned as-is instead of being copied.
+    
     Args:
         a: Existing dictionary in state
         b: New dictionary to merge in
@@ -46,18 +53,19 @@ def merge_dicts(a: dict, b: dict) -> dict:
     Returns:
         Merged dictionary with all keys from both
     """
-    if a is None:
+    if not a:
         return b or {}
-    if b is None:
+    if not b:
         return a
-    return {**a, **b}
+    return a | b
 
 
 def merge_lists(a: list, b: list) -> list:
     """
     Reducer that concatenates two lists.
     
-    Used for accumulating errors from parallel branches.
+    Used for accumulating errors from parallel branches. Like merge_dicts,
+    inputs are never mutated and an empty side is returned without copying.
     
     Args:
         a: Existing list in state
@@ -66,13 +74,40 @@ def merge_lists(a: list, b: list) -> list:
     Returns:
         Concatenated list
     """
-    if a is None:
+    if not a:
         return b or []
-    if b is None:
+    if not b:
         return a
     return a + b
 
 
+def merge_errors(a: list[ErrorLog], b: list[ErrorLog]) -> list[ErrorLog]:
+    """
+    Reducer that appends new errors, skipping repeats.
+    
+    An error counts as a repeat when an earlier entry has the same agent,
+    ICP and message (timestamps are ignored), so a failure reported again
+    on retry is only logged once. Inputs are never mutated.
+    
+    Args:
+        a: Existing errors in state
+        b: New errors to append
+        
+    Returns:
+        Errors from a followed by the unseen errors from b
+    """
+    if not b:
+        return a or []
+    seen = {(e.agent_name, e.icp_id, e.error_message) for e in a} if a else set()
+    merged = list(a) if a else []
+    for error in b:
+        key = (error.agent_name, error.icp_id, error.error_message)
+        if key not in seen:
+            seen.add(key)
+            merged.append(error)
+    return merged
+
+
 # =============================================================================
 # BASIC STATE (for individual agents and simple tests)
 # =============================================================================
@@ -132,7 +167,7 @@ class GraphState(TypedDict, total=False):
     
     Reducer behavior:
     - merge_dicts: For strategies, concepts, copy, scenes, final_ads
-    - merge_lists: For errors
+    - merge_errors: For errors (repeats dropped)
     - No reducer: For inputs (set once) and icps (set by segmentation only)
     
     Usage:
@@ -162,7 +197,7 @@ class GraphState(TypedDict, total=False):
     # === METADATA ===
     run_id: str
     created_at: datetime
-    errors: Annotated[list[ErrorLog], merge_lists]  # Accumulate errors from all branches
+    errors: Annotated[list[ErrorLog], merge_errors]  # Accumulate errors from all branches
     
     # === GRAPH CONTROL (used internally by graph routing) ===
     current_icp_id: str | None  # Set when processing a specific ICP
@@ -196,28 +231,27 @@ def create_initial_state(
     Returns:
         Initialized AdCreationState ready for pipeline execution
     """
-    import uuid
-
-    return AdCreationState(
+    state: AdCreationState = {
         # Inputs
-        product=product,
-        store_brand=store_brand,
-        product_brand=product_brand,
-        brand_strategy=brand_strategy,
-        channel=channel,
-        store_context=store_context,
+        "product": product,
+        "store_brand": store_brand,
+        "product_brand": product_brand,
+        "brand_strategy": brand_strategy,
+        "channel": channel,
+        "store_context": store_context,
         # Empty agent outputs
-        icps=[],
-        strategies={},
-        concepts={},
-        copy={},
-        scenes={},
-        final_ads={},
+        "icps": [],
+        "strategies": {},
+        "concepts": {},
+        "copy": {},
+        "scenes": {},
+        "final_ads": {},
         # Metadata
-        run_id=run_id or str(uuid.uuid4()),
-        created_at=datetime.now(),
-        errors=[],
-    )
+        "run_id": run_id or str(uuid.uuid4()),
+        "created_at": datetime.now(),
+        "errors": [],
+    }
+    return state
 
 
 def create_graph_state(
@@ -247,27 +281,26 @@ def create_graph_state(
     Returns:
         Initialized GraphState ready for LangGraph pipeline execution
     """
-    import uuid
-
-    return GraphState(
+    state: GraphState = {
         # Inputs
-        product=product,
-        store_brand=store_brand,
-        product_brand=product_brand,
-        brand_strategy=brand_strategy,
-        channel=channel,
-        store_context=store_context,
+        "product": product,
+        "store_brand": store_brand,
+        "product_brand": product_brand,
+        "brand_strategy": brand_strategy,
+        "channel": channel,
+        "store_context": store_context,
         # Empty agent outputs
-        icps=[],
-        strategies={},
-        concepts={},
-        copy={},
-        scenes={},
-        final_ads={},
+        "icps": [],
+        "strategies": {},
+        "concepts": {},
+        "copy": {},
+        "scenes": {},
+        "final_ads": {},
         # Metadata
-        run_id=run_id or str(uuid.uuid4()),
-        created_at=datetime.now(),
-        errors=[],
+        "run_id": run_id or str(uuid.uuid4()),
+        "created_at": datetime.now(),
+        "errors": [],
         # Graph control
-        current_icp_id=None,
-    )
+        "current_icp_id": None,
+    }
+    return state
@@ -4,23 +4,48 @@ Sartor Ad Engine - Utilities.
 Shared utility functions for the ad generation pipeline.
 """
 
-from .image_utils import (
-    load_image_from_path,
-    load_image_from_url,
-    resize_image,
-    save_image,
-    validate_image_dimensions,
-)
-from .llm_factory import create_llm, create_llm_for_agent
+import importlib
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so image helpers don't pull in LangChain.
+_LAZY_EXPORTS = {
+    "create_llm": "llm_factory",
+    "create_llm_for_agent": "llm_factory",
+    "get_http_client": "image_utils",
+    "close_http_client": "image_utils",
+    "aload_image_from_path": "image_utils",
+    "load_image_from_path": "image_utils",
+    "load_image_from_url": "image_utils",
+    "validate_image_dimensions": "image_utils",
+    "resize_image": "image_utils",
+    "save_image": "image_utils",
+}
 
 __all__ = [
     # LLM Factory
     "create_llm",
     "create_llm_for_agent",
     # Image Utils
+    "get_http_client",
+    "close_http_client",
+    "aload_image_from_path",
     "load_image_from_path",
     "load_image_from_url",
     "validate_image_dimensions",
     "resize_image",
     "save_image",
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access and cache the export."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -5,7 +5,10 @@ Provides factory functions to create LangChain LLM clients
 based on model name prefixes.
 """
 
+from __future__ import annotations
+
 import time
+from functools import lru_cache
 from threading import Lock
 from typing import Literal
 
@@ -25,27 +28,49 @@ AGENT_TEMPERATURES: dict[AgentName, float] = {
     "copy": 0.6,          # Creative but controlled
 }
 
+# Settings attribute holding each agent's model name
+AGENT_MODEL_SETTINGS: dict[AgentName, str] = {
+    "segmentation": "segmentation_model",
+    "strategy": "strategy_model",
+    "concept": "concept_model",
+    "copy": "copy_model",
+}
+
 
 class RateLimiter:
     """
-    Thread-safe rate limiter for LLM API calls.
+    Thread-safe token-bucket rate limiter for LLM API calls.
     
-    Used to respect free tier limits. Set rpm=0 to disable.
+    Allows a burst of up to rpm calls (e.g. parallel ICP branches starting
+    together), then refills at rpm per minute. Used to respect free tier
+    limits. Set rpm=0 to disable.
     Remove this class when upgrading to a paid tier.
     """
-    _last_call: float = 0
+    _tokens: float | None = None  # None until first use (bucket starts full)
+    _last_refill: float = 0.0
     _lock = Lock()
     
     @classmethod
     def wait(cls, rpm: float) -> None:
         if rpm <= 0:
             return
-        interval = 60.0 / rpm
+        capacity = max(rpm, 1.0)
+        refill_per_second = rpm / 60.0
         with cls._lock:
-            elapsed = time.time() - cls._last_call
-            if elapsed < interval:
-                time.sleep(interval - elapsed)
-            cls._last_call = time.time()
+            # Monotonic clock: wall-clock adjustments can't skew the refill
+            now = time.monotonic()
+            if cls._tokens is None:
+                cls._tokens = capacity
+            else:
+                elapsed = now - cls._last_refill
+                cls._tokens = min(capacity, cls._tokens + elapsed * refill_per_second)
+            cls._last_refill = now
+            
+            if cls._tokens < 1:
+                time.sleep((1 - cls._tokens) / refill_per_second)
+                cls._tokens = 1.0
+                cls._last_refill = time.monotonic()
+            cls._tokens -= 1
 
 
 def create_llm(
@@ -60,6 +85,9 @@ def create_llm(
     - Gemini models (prefix: "gemini")
     - Claude models (prefix: "claude")
     
+    Each call is rate limited, but the client itself is built once per
+    (model_name, temperature, kwargs) and reused; kwargs must be hashable.
+    
     Args:
         model_name: Model identifier (e.g., "gemini-2.0-flash", "claude-sonnet-4-20250514").
                     Required - use create_llm_for_agent() for agent-specific defaults.
@@ -77,6 +105,25 @@ def create_llm(
     # Rate limit for free tier support (set rpm=0 to disable)
     RateLimiter.wait(settings.llm_rate_limit_rpm)
 
+    return _build_llm(model_name, temperature, tuple(sorted(kwargs.items())))
+
+
+@lru_cache(maxsize=16)
+def _build_llm(
+    model_name: str,
+    temperature: float,
+    frozen_kwargs: tuple[tuple[str, object], ...],
+) -> BaseChatModel:
+    """
+    Construct (once per model/temperature/kwargs) the chat model client.
+    
+    LangChain chat models are stateless between calls, so one client - and
+    its HTTP connection pool - is shared by every agent invocation using the
+    same configuration. Use _build_llm.cache_clear() after changing API keys.
+    """
+    settings = get_settings()
+    kwargs = dict(frozen_kwargs)
+
     if model_name.startswith("gemini"):
         if not settings.google_api_key:
             raise ValueError("GOOGLE_API_KEY not set in environment")
@@ -137,26 +184,19 @@ def create_llm_for_agent(
     Raises:
         ValueError: If agent_name is not recognized
     """
-    settings = get_settings()
-
-    model_mapping: dict[AgentName, str] = {
-        "segmentation": settings.segmentation_model,
-        "strategy": settings.strategy_model,
-        "concept": settings.concept_model,
-        "copy": settings.copy_model,
-    }
-
-    if agent_name not in model_mapping:
+    if agent_name not in AGENT_MODEL_SETTINGS:
         raise ValueError(
             f"Unknown agent: {agent_name}. "
-            f"Valid agents: {list(model_mapping.keys())}"
+            f"Valid agents: {list(AGENT_MODEL_SETTINGS)}"
         )
 
+    model_name = getattr(get_settings(), AGENT_MODEL_SETTINGS[agent_name])
+
     # Use provided temperature or fall back to agent-specific default
     temp = temperature if temperature is not None else AGENT_TEMPERATURES[agent_name]
 
     return create_llm(
-        model_name=model_mapping[agent_name],
+        model_name=model_name,
         temperature=temp,
         **kwargs,
     )
@@ -8,6 +8,26 @@ from pathlib import Path
 import pytest
 
 
+def pytest_addoption(parser):
+    """Add --run-slow to opt in to tests that run the real pipeline."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (full pipeline against live model APIs)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow was given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test: pass --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture
 def samples_dir() -> Path:
     """Path to sample data directory."""
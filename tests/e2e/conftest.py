@@ -2,12 +2,15 @@
 Pytest configuration and fixtures for E2E tests.
 """
 
-import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Generator
 
 import pytest
 
+from src.runner import load_product_input
+
 
 # =============================================================================
 # PATHS
@@ -55,12 +58,14 @@ def test_case_paths(samples_dir: Path) -> dict[str, Path]:
     }
 
 
+@functools.lru_cache(maxsize=None)
 def load_test_case(samples_dir: Path, test_case: str) -> dict:
-    """Load a test case JSON file."""
+    """Load a test case JSON file (parsed once per session; treat as read-only)."""
     path = samples_dir / f"{test_case}.json"
     if not path.exists():
         raise FileNotFoundError(f"Test case file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    # Same loader as the pipeline, which uses orjson when it is installed
+    return load_product_input(str(path))
 
 
 @pytest.fixture
@@ -103,13 +108,13 @@ def pipeline_results(samples_dir: Path, output_dir: Path) -> dict:
     Run the pipeline for all test cases and return results.
     
     This is session-scoped to avoid re-running the full pipeline
-    multiple times. Results are cached for the test session.
+    multiple times. Results are cached for the test session. Cases are
+    independent and spend their time waiting on model APIs, so they run
+    concurrently.
     """
     from src.runner import run_pipeline
     
-    results = {}
-    
-    for tc in TEST_CASES:
+    def run_case(tc: str) -> dict:
         tc_input = samples_dir / f"{tc}.json"
         tc_output = output_dir / tc
         tc_output.mkdir(parents=True, exist_ok=True)
@@ -121,18 +126,41 @@ def pipeline_results(samples_dir: Path, output_dir: Path) -> dict:
                 run_id=tc,
                 verbose=False,
             )
-            results[tc] = {
+            return {
                 "state": state,
                 "success": True,
                 "error": None,
                 "output_dir": tc_output,
             }
         except Exception as e:
-            results[tc] = {
+            return {
                 "state": None,
                 "success": False,
                 "error": str(e),
                 "output_dir": tc_output,
             }
     
-    return results
+    with ThreadPoolExecutor(max_workers=len(TEST_CASES)) as executor:
+        futures = {tc: executor.submit(run_case, tc) for tc in TEST_CASES}
+        return {tc: future.result() for tc, future in futures.items()}
+
+
+@pytest.fixture(scope="session")
+def validation_results(pipeline_results: dict, samples_dir: Path) -> dict:
+    """
+    Run all validations once per completed test case.
+    
+    Maps test case name to run_all_validations output. Cases whose pipeline
+    did not complete are left out; tests check pipeline_results first.
+    """
+    from tests.e2e.validators import run_all_validations
+    
+    return {
+        tc: run_all_validations(
+            state=result["state"],
+            channel=load_test_case(samples_dir, tc)["channel"],
+            output_dir=result["output_dir"],
+        )
+        for tc, result in pipeline_results.items()
+        if result["success"]
+    }
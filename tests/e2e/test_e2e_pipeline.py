@@ -18,16 +18,11 @@ from pathlib import Path
 import pytest
 
 from tests.e2e.conftest import TEST_CASES, load_test_case
-from tests.e2e.validators import (
-    run_all_validations,
-    validate_icps_generated,
-    validate_pipeline_complete,
-    validate_copy_limits,
-    validate_ad_dimensions,
-    validate_icps_distinct,
-    validate_no_errors,
-    validate_final_ads_exist,
-)
+from tests.e2e.validators import run_all_validations
+
+
+# Every test here depends on pipeline_results, which runs the full pipeline
+pytestmark = pytest.mark.slow
 
 
 # =============================================================================
@@ -55,6 +50,7 @@ class TestPipelineExecution:
         self,
         test_case: str,
         pipeline_results: dict,
+        validation_results: dict,
     ):
         """Verify no errors were logged during pipeline execution."""
         result = pipeline_results[test_case]
@@ -62,7 +58,7 @@ class TestPipelineExecution:
         if not result["success"]:
             pytest.skip(f"Pipeline did not complete: {result['error']}")
         
-        passed, msg = validate_no_errors(result["state"])
+        passed, msg = validation_results[test_case]["no_errors"]
         assert passed, msg
 
 
@@ -78,6 +74,7 @@ class TestICPGeneration:
         self,
         test_case: str,
         pipeline_results: dict,
+        validation_results: dict,
     ):
         """Verify at least 1 ICP was generated."""
         result = pipeline_results[test_case]
@@ -85,7 +82,7 @@ class TestICPGeneration:
         if not result["success"]:
             pytest.skip(f"Pipeline did not complete: {result['error']}")
         
-        passed, msg = validate_icps_generated(result["state"], min_count=1)
+        passed, msg = validation_results[test_case]["icps_generated"]
         assert passed, msg
     
     @pytest.mark.parametrize("test_case", TEST_CASES)
@@ -93,6 +90,7 @@ class TestICPGeneration:
         self,
         test_case: str,
         pipeline_results: dict,
+        validation_results: dict,
     ):
         """Verify ICPs have unique names (are distinct)."""
         result = pipeline_results[test_case]
@@ -100,7 +98,7 @@ class TestICPGeneration:
         if not result["success"]:
             pytest.skip(f"Pipeline did not complete: {result['error']}")
         
-        passed, msg = validate_icps_distinct(result["state"])
+        passed, msg = validation_results[test_case]["icps_distinct"]
         assert passed, msg
 
 
@@ -116,6 +114,7 @@ class TestPipelineCompleteness:
         self,
         test_case: str,
         pipeline_results: dict,
+        validation_results: dict,
     ):
         """Verify each ICP has strategy, concept, copy, scene, and final_ad."""
         result = pipeline_results[test_case]
@@ -123,7 +122,7 @@ class TestPipelineCompleteness:
         if not result["success"]:
             pytest.skip(f"Pipeline did not complete: {result['error']}")
         
-        passed, msg = validate_pipeline_complete(result["state"])
+        passed, msg = validation_results[test_case]["pipeline_complete"]
         assert passed, msg
 
 
@@ -139,7 +138,7 @@ class TestCopyValidation:
         self,
         test_case: str,
         pipeline_results: dict,
-        samples_dir: Path,
+        validation_results: dict,
     ):
         """Verify all copy is within channel character limits."""
         result = pipeline_results[test_case]
@@ -147,11 +146,7 @@ class TestCopyValidation:
         if not result["success"]:
             pytest.skip(f"Pipeline did not complete: {result['error']}")
         
-        # Load the test case to get channel constraints
-        test_data = load_test_case(samples_dir, test_case)
-        channel = test_data["channel"]
-        
-        passed, msg = validate_copy_limits(result["state"], channel)
+        passed, msg = validation_results[test_case]["copy_limits"]
         assert passed, msg
 
 
@@ -167,7 +162,7 @@ class TestAdOutput:
         self,
         test_case: str,
         pipeline_results: dict,
-        samples_dir: Path,
+        validation_results: dict,
     ):
         """Verify final ads have correct dimensions."""
         result = pipeline_results[test_case]
@@ -175,11 +170,7 @@ class TestAdOutput:
         if not result["success"]:
             pytest.skip(f"Pipeline did not complete: {result['error']}")
         
-        # Load the test case to get channel dimensions
-        test_data = load_test_case(samples_dir, test_case)
-        channel = test_data["channel"]
-        
-        passed, msg = validate_ad_dimensions(result["state"], channel)
+        passed, msg = validation_results[test_case]["ad_dimensions"]
         assert passed, msg
     
     @pytest.mark.parametrize("test_case", TEST_CASES)
@@ -187,6 +178,7 @@ class TestAdOutput:
         self,
         test_case: str,
         pipeline_results: dict,
+        validation_results: dict,
     ):
         """Verify final ad image files exist on disk."""
         result = pipeline_results[test_case]
@@ -194,10 +186,7 @@ class TestAdOutput:
         if not result["success"]:
             pytest.skip(f"Pipeline did not complete: {result['error']}")
         
-        passed, msg = validate_final_ads_exist(
-            result["state"],
-            result["output_dir"],
-        )
+        passed, msg = validation_results[test_case]["ads_exist"]
         assert passed, msg
 
 
@@ -213,7 +202,7 @@ class TestComprehensiveValidation:
         self,
         test_case: str,
         pipeline_results: dict,
-        samples_dir: Path,
+        validation_results: dict,
     ):
         """Run all validation checks for each test case."""
         result = pipeline_results[test_case]
@@ -221,16 +210,7 @@ class TestComprehensiveValidation:
         if not result["success"]:
             pytest.fail(f"Pipeline did not complete: {result['error']}")
         
-        # Load the test case to get channel context
-        test_data = load_test_case(samples_dir, test_case)
-        channel = test_data["channel"]
-        
-        # Run all validations
-        validations = run_all_validations(
-            state=result["state"],
-            channel=channel,
-            output_dir=result["output_dir"],
-        )
+        validations = validation_results[test_case]
         
         # Check for any failures
         failures = [
@@ -251,11 +231,14 @@ def generate_test_results_summary(
     pipeline_results: dict,
     samples_dir: Path,
     output_path: Path,
+    validation_results: dict | None = None,
 ) -> None:
     """
     Generate a markdown summary of test results.
     
-    Call this after running the test suite to generate docs/test_results.md
+    Call this after running the test suite to generate docs/test_results.md.
+    Pass the session's validation_results to reuse its checks instead of
+    running them again.
     """
     lines = [
         "# Phase 6 E2E Test Results",
@@ -304,16 +287,15 @@ def generate_test_results_summary(
         icps = state.get("icps", [])
         final_ads = state.get("final_ads", {})
         
-        # Load test case for validation
-        test_data = load_test_case(samples_dir, tc)
-        channel = test_data["channel"]
-        
-        # Run validations
-        validations = run_all_validations(
-            state=state,
-            channel=channel,
-            output_dir=result["output_dir"],
-        )
+        # Reuse the session's validations when available
+        if validation_results is not None and tc in validation_results:
+            validations = validation_results[tc]
+        else:
+            validations = run_all_validations(
+                state=state,
+                channel=load_test_case(samples_dir, tc)["channel"],
+                output_dir=result["output_dir"],
+            )
         
         lines.append("**ICPs Generated:**")
         for icp in icps:
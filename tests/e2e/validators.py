@@ -4,6 +4,7 @@ Validation utilities for E2E testing.
 Each validator returns a tuple of (passed: bool, message: str).
 """
 
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -39,31 +40,30 @@ def validate_pipeline_complete(state: dict) -> tuple[bool, str]:
         (passed, message) tuple
     """
     icps = state.get("icps", [])
-    strategies = state.get("strategies", {})
-    concepts = state.get("concepts", {})
-    copy = state.get("copy", {})
-    scenes = state.get("scenes", {})
-    final_ads = state.get("final_ads", {})
+    stage_outputs = {
+        "strategy": state.get("strategies", {}),
+        "concept": state.get("concepts", {}),
+        "copy": state.get("copy", {}),
+        "scene": state.get("scenes", {}),
+        "final_ad": state.get("final_ads", {}),
+    }
     
-    missing = []
+    # One set difference per stage instead of a membership test per ICP
+    icp_ids = {icp.icp_id for icp in icps}
+    missing_by_stage = {
+        stage: icp_ids - outputs.keys()
+        for stage, outputs in stage_outputs.items()
+    }
     
-    for icp in icps:
-        icp_id = icp.icp_id
-        icp_missing = []
-        
-        if icp_id not in strategies:
-            icp_missing.append("strategy")
-        if icp_id not in concepts:
-            icp_missing.append("concept")
-        if icp_id not in copy:
-            icp_missing.append("copy")
-        if icp_id not in scenes:
-            icp_missing.append("scene")
-        if icp_id not in final_ads:
-            icp_missing.append("final_ad")
-        
-        if icp_missing:
-            missing.append(f"{icp.name}: missing {', '.join(icp_missing)}")
+    missing = []
+    if any(missing_by_stage.values()):
+        for icp in icps:
+            icp_missing = [
+                stage for stage, ids in missing_by_stage.items()
+                if icp.icp_id in ids
+            ]
+            if icp_missing:
+                missing.append(f"{icp.name}: missing {', '.join(icp_missing)}")
     
     if not missing:
         return True, f"All {len(icps)} ICPs have complete outputs"
@@ -153,8 +153,8 @@ def validate_icps_distinct(state: dict) -> tuple[bool, str]:
     if len(names) == len(set(names)):
         return True, f"All {len(names)} ICP names are unique"
     else:
-        duplicates = [name for name in names if names.count(name) > 1]
-        return False, f"Duplicate ICP names: {set(duplicates)}"
+        duplicates = {name for name, count in Counter(names).items() if count > 1}
+        return False, f"Duplicate ICP names: {duplicates}"
 
 
 def validate_no_errors(state: dict) -> tuple[bool, str]:
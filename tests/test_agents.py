@@ -23,6 +23,7 @@ from src.models import (
     StrategicBrief,
     TextConstraints,
 )
+from src.config import get_settings
 from src.state import create_initial_state
 
 
@@ -30,7 +31,7 @@ from src.state import create_initial_state
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_product():
     """Create a mock product for testing."""
     return ProductData(
@@ -45,7 +46,7 @@ def mock_product():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_store_brand():
     """Create a mock store brand for testing."""
     return BrandContext(
@@ -58,7 +59,7 @@ def mock_store_brand():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_channel():
     """Create a mock channel context for testing."""
     return ChannelContext(
@@ -73,7 +74,7 @@ def mock_channel():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_icp():
     """Create a mock ICP for testing."""
     return ICP(
@@ -103,7 +104,7 @@ def mock_icp():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_strategy(mock_icp):
     """Create a mock strategic brief for testing."""
     return StrategicBrief(
@@ -118,7 +119,7 @@ def mock_strategy(mock_icp):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_concept(mock_icp):
     """Create a mock creative concept for testing."""
     return CreativeConcept(
@@ -138,9 +139,23 @@ def mock_concept(mock_icp):
     )
 
 
+@pytest.fixture
+def mock_llm_factory():
+    """Build a mock LLM whose structured-output invoke returns `response` or raises `error`."""
+    def make(response=None, error: Exception | None = None):
+        mock_llm = MagicMock()
+        invoke = mock_llm.with_structured_output.return_value.invoke
+        if error is not None:
+            invoke.side_effect = error
+        else:
+            invoke.return_value = response
+        return mock_llm
+    return make
+
+
 @pytest.fixture
 def mock_state(mock_product, mock_store_brand, mock_channel):
-    """Create a mock state for testing."""
+    """Create a fresh mock state per test (tests assign into it; the models are shared)."""
     return create_initial_state(
         product=mock_product,
         store_brand=mock_store_brand,
@@ -156,7 +171,7 @@ def mock_state(mock_product, mock_store_brand, mock_channel):
 class TestSegmentationAgent:
     """Tests for the Segmentation Agent."""
 
-    def test_segmentation_returns_icps_on_success(self, mock_state, mock_icp):
+    def test_segmentation_returns_icps_on_success(self, mock_state, mock_icp, mock_llm_factory):
         """Verify segmentation returns list of ICPs on successful LLM call."""
         from agents.segmentation.agent import SegmentationResponse, run_segmentation_agent
         
@@ -191,9 +206,7 @@ class TestSegmentationAgent:
         mock_response = SegmentationResponse(icps=[mock_icp, mock_icp_2])
         
         with patch("agents.segmentation.agent.create_llm_for_agent") as mock_create_llm:
-            mock_llm = MagicMock()
-            mock_llm.with_structured_output.return_value.invoke.return_value = mock_response
-            mock_create_llm.return_value = mock_llm
+            mock_create_llm.return_value = mock_llm_factory(mock_response)
             
             result = run_segmentation_agent(mock_state)
         
@@ -201,14 +214,12 @@ class TestSegmentationAgent:
         assert len(result["icps"]) == 2
         assert result["icps"][0].icp_id == mock_icp.icp_id
 
-    def test_segmentation_handles_llm_error(self, mock_state):
+    def test_segmentation_handles_llm_error(self, mock_state, mock_llm_factory):
         """Verify segmentation gracefully handles LLM failures."""
         from agents.segmentation.agent import run_segmentation_agent
         
         with patch("agents.segmentation.agent.create_llm_for_agent") as mock_create_llm:
-            mock_llm = MagicMock()
-            mock_llm.with_structured_output.return_value.invoke.side_effect = Exception("API Error")
-            mock_create_llm.return_value = mock_llm
+            mock_create_llm.return_value = mock_llm_factory(error=Exception("API Error"))
             
             result = run_segmentation_agent(mock_state)
         
@@ -224,7 +235,7 @@ class TestSegmentationAgent:
 class TestStrategyAgent:
     """Tests for the Strategy Agent."""
 
-    def test_strategy_processes_all_icps(self, mock_state, mock_icp, mock_strategy):
+    def test_strategy_processes_all_icps(self, mock_state, mock_icp, mock_strategy, mock_llm_factory):
         """Verify strategy generates brief for each ICP."""
         from agents.strategy.agent import run_strategy_agent
         
@@ -232,9 +243,7 @@ class TestStrategyAgent:
         mock_state["icps"] = [mock_icp]
         
         with patch("agents.strategy.agent.create_llm_for_agent") as mock_create_llm:
-            mock_llm = MagicMock()
-            mock_llm.with_structured_output.return_value.invoke.return_value = mock_strategy
-            mock_create_llm.return_value = mock_llm
+            mock_create_llm.return_value = mock_llm_factory(mock_strategy)
             
             result = run_strategy_agent(mock_state)
         
@@ -260,7 +269,7 @@ class TestStrategyAgent:
 class TestConceptAgent:
     """Tests for the Concept Agent."""
 
-    def test_concept_uses_strategy(self, mock_state, mock_icp, mock_strategy, mock_concept):
+    def test_concept_uses_strategy(self, mock_state, mock_icp, mock_strategy, mock_concept, mock_llm_factory):
         """Verify concept agent uses strategy from prior agent."""
         from agents.concept.agent import run_concept_agent
         
@@ -268,9 +277,7 @@ class TestConceptAgent:
         mock_state["strategies"] = {mock_icp.icp_id: mock_strategy}
         
         with patch("agents.concept.agent.create_llm_for_agent") as mock_create_llm:
-            mock_llm = MagicMock()
-            mock_llm.with_structured_output.return_value.invoke.return_value = mock_concept
-            mock_create_llm.return_value = mock_llm
+            mock_create_llm.return_value = mock_llm_factory(mock_concept)
             
             result = run_concept_agent(mock_state)
         
@@ -286,7 +293,7 @@ class TestConceptAgent:
 class TestCopyAgent:
     """Tests for the Copy Agent."""
 
-    def test_copy_generates_ad_copy(self, mock_state, mock_icp, mock_strategy, mock_concept):
+    def test_copy_generates_ad_copy(self, mock_state, mock_icp, mock_strategy, mock_concept, mock_llm_factory):
         """Verify copy agent generates ad copy for ICP."""
         from agents.copy.agent import run_copy_agent
         
@@ -305,9 +312,7 @@ class TestCopyAgent:
         )
         
         with patch("agents.copy.agent.create_llm_for_agent") as mock_create_llm:
-            mock_llm = MagicMock()
-            mock_llm.with_structured_output.return_value.invoke.return_value = mock_ad_copy
-            mock_create_llm.return_value = mock_llm
+            mock_create_llm.return_value = mock_llm_factory(mock_ad_copy)
             
             result = run_copy_agent(mock_state)
         
@@ -339,3 +344,127 @@ class TestDesignAgent:
         assert asset.width == 1080
         assert asset.height == 1080
         assert asset.prompt_used is not None
+
+
+# =============================================================================
+# PROCESS ICP NODE TESTS
+# =============================================================================
+
+class TestProcessICPNode:
+    """Tests for the per-ICP graph node."""
+
+    def test_design_failure_keeps_copy(self, mock_state, mock_icp, mock_strategy, mock_concept):
+        """Verify a Design failure still records Copy and skips Composition."""
+        from src.graph import process_icp_node
+        
+        mock_state["icps"] = [mock_icp]
+        mock_state["current_icp_id"] = mock_icp.icp_id
+        mock_ad_copy = AdCopy(
+            icp_id=mock_icp.icp_id,
+            headline="Your Focus, Engineered",
+            body_copy="40 hours of silence.",
+            cta_text="Shop Now",
+        )
+        
+        with patch("src.graph.run_strategy_for_icp", return_value=mock_strategy), \
+             patch("src.graph.run_concept_for_icp", return_value=mock_concept), \
+             patch("src.graph.run_copy_for_icp", return_value=mock_ad_copy), \
+             patch("src.graph.generate_scene_for_icp", side_effect=RuntimeError("imagen down")), \
+             patch("src.graph._run_composition") as mock_compose:
+            result = process_icp_node(mock_state)
+        
+        assert result["copy"][mock_icp.icp_id] is mock_ad_copy
+        assert "scenes" not in result
+        assert [e.agent_name for e in result["errors"]] == ["design"]
+        mock_compose.assert_not_called()
+
+    def test_fanout_sends_only_branch_inputs(self, mock_state, mock_icp, mock_strategy, mock_concept):
+        """Verify each ICP branch gets the campaign inputs and only its own ICP."""
+        from src.graph import build_graph
+        
+        second_icp = mock_icp.model_copy(update={"icp_id": "test_icp_002"})
+        seen_states = []
+        
+        def fake_strategy(state, icp):
+            seen_states.append(state)
+            return mock_strategy
+        
+        with patch("src.graph.run_segmentation_agent", return_value={"icps": [mock_icp, second_icp]}), \
+             patch("src.graph.run_strategy_for_icp", side_effect=fake_strategy), \
+             patch("src.graph.run_concept_for_icp", side_effect=RuntimeError("stop here")):
+            final_state = build_graph().invoke(mock_state)
+        
+        assert {s["current_icp_id"] for s in seen_states} == {"test_icp_001", "test_icp_002"}
+        for branch_state in seen_states:
+            assert [i.icp_id for i in branch_state["icps"]] == [branch_state["current_icp_id"]]
+            assert branch_state["product"] == mock_state["product"]
+            assert branch_state["run_id"] == mock_state["run_id"]
+        assert set(final_state["strategies"]) == {"test_icp_001", "test_icp_002"}
+
+    def test_graph_cache_reuses_llm_stages_only(
+        self, mock_state, mock_icp, mock_strategy, mock_concept, monkeypatch
+    ):
+        """Verify caching skips repeated LLM stages but reruns Design and Composition."""
+        from src.graph import _stage_cache, build_graph
+        
+        monkeypatch.setattr(get_settings(), "graph_cache_ttl", 60)
+        _stage_cache.clear()
+        mock_ad_copy = AdCopy(
+            icp_id=mock_icp.icp_id,
+            headline="Your Focus, Engineered",
+            body_copy="40 hours of silence.",
+            cta_text="Shop Now",
+        )
+        
+        with patch("src.graph.run_segmentation_agent", return_value={"icps": [mock_icp]}) as mock_segment, \
+             patch("src.graph.run_strategy_for_icp", return_value=mock_strategy) as mock_run_strategy, \
+             patch("src.graph.run_concept_for_icp", return_value=mock_concept), \
+             patch("src.graph.run_copy_for_icp", return_value=mock_ad_copy) as mock_copy, \
+             patch("src.graph.generate_scene_for_icp", side_effect=RuntimeError("imagen down")) as mock_design:
+            graph = build_graph()
+            graph.invoke(mock_state)
+            graph.invoke({**mock_state, "run_id": "another-run"})
+        _stage_cache.clear()
+        
+        assert mock_segment.call_count == 1
+        assert mock_run_strategy.call_count == 1
+        assert mock_copy.call_count == 1
+        assert mock_design.call_count == 2
+
+    def test_error_reducer_drops_repeats(self):
+        """Verify repeated errors are logged once while per-ICP errors are kept."""
+        from src.models import ErrorLog
+        from src.state import merge_errors
+        
+        first = [ErrorLog(agent_name="copy", icp_id="icp_1", error_message="timeout")]
+        update = [
+            ErrorLog(agent_name="copy", icp_id="icp_1", error_message="timeout"),
+            ErrorLog(agent_name="copy", icp_id="icp_2", error_message="timeout"),
+        ]
+        
+        merged = merge_errors(first, update)
+        
+        assert [e.icp_id for e in merged] == ["icp_1", "icp_2"]
+        assert len(first) == 1
+
+
+# =============================================================================
+# RATE LIMITER TESTS
+# =============================================================================
+
+class TestRateLimiter:
+    """Tests for the shared LLM rate limiter."""
+
+    def test_burst_then_throttle(self, monkeypatch):
+        """Verify a full bucket allows a burst and an empty one sleeps."""
+        from src.utils.llm_factory import RateLimiter
+        
+        monkeypatch.setattr(RateLimiter, "_tokens", None)
+        with patch("src.utils.llm_factory.time.sleep") as mock_sleep:
+            for _ in range(3):
+                RateLimiter.wait(3)
+            mock_sleep.assert_not_called()
+            
+            RateLimiter.wait(3)
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args.args[0] == pytest.approx(20, abs=0.5)
@@ -6,7 +6,7 @@ Covers layout specs, product placement, text rendering, and full composition.
 
 import pytest
 from pathlib import Path
-from PIL import Image
+from PIL import Image, ImageDraw
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from src.composition.templates.layout_specs import (
@@ -22,16 +22,23 @@ from src.composition.product_placer import (
     resize_product_image,
     has_transparency,
     apply_drop_shadow,
+    load_product_image,
+    remove_background,
 )
 from src.composition.text_renderer import (
     wrap_text,
     get_text_size,
     load_font,
+    draw_text,
+    render_headline,
 )
 from src.composition.compositor import (
     Compositor,
     CompositionInput,
+    compose_ad,
+    warm_caches,
 )
+from src.config import get_settings
 from src.models.brand import BrandContext, ColorPalette
 from src.models.channel import ChannelContext, Dimensions, TextConstraints
 from src.models.concept import CreativeConcept, ProductPlacement
@@ -48,20 +55,26 @@ def sample_canvas() -> Image.Image:
     return Image.new("RGBA", (1080, 1080), (50, 50, 50, 255))
 
 
-@pytest.fixture
-def sample_product_image(tmp_path: Path) -> Path:
-    """Create a sample product image."""
+@pytest.fixture(scope="session")
+def sample_images_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide directory for read-only source images."""
+    return tmp_path_factory.mktemp("sample_images")
+
+
+@pytest.fixture(scope="session")
+def sample_product_image(sample_images_dir: Path) -> Path:
+    """Create a sample product image (shared; tests must not modify it)."""
     img = Image.new("RGBA", (500, 500), (255, 0, 0, 255))
-    path = tmp_path / "product.png"
+    path = sample_images_dir / "product.png"
     img.save(path)
     return path
 
 
-@pytest.fixture
-def sample_background_image(tmp_path: Path) -> Path:
-    """Create a sample background image."""
+@pytest.fixture(scope="session")
+def sample_background_image(sample_images_dir: Path) -> Path:
+    """Create a sample background image (shared; tests must not modify it)."""
     img = Image.new("RGB", (1080, 1080), (30, 30, 60))
-    path = tmp_path / "background.png"
+    path = sample_images_dir / "background.png"
     img.save(path)
     return path
 
@@ -171,6 +184,12 @@ class TestLayoutSpecs:
         
         assert "Hero" in layout.name
     
+    def test_get_layout_spec_normalized_match(self):
+        """Test case and punctuation variants resolve without fuzzy matching."""
+        layout = get_layout_spec("problem-solution split")
+        
+        assert layout.name == "Problem/Solution Split"
+    
     def test_get_layout_spec_fallback(self):
         """Test fallback to default layout."""
         layout = get_layout_spec("NonexistentLayout")
@@ -193,6 +212,17 @@ class TestLayoutSpecs:
             assert spec.body_zone is not None, f"{name} missing body_zone"
             assert spec.cta_zone is not None, f"{name} missing cta_zone"
             assert spec.logo_zone is not None, f"{name} missing logo_zone"
+    
+    def test_pixel_rects_match_zone_bounds(self):
+        """Test precomputed pixel rects agree with get_bounds."""
+        spec = get_layout_spec("Hero Product with Stat Overlay")
+        rects = spec.pixel_rects(1080, 1350)
+        
+        assert set(rects) >= {"product_zone", "headline_zone", "body_zone", "cta_zone", "logo_zone"}
+        logo = rects["logo_zone"]
+        assert (logo.x1, logo.y1, logo.x2, logo.y2) == spec.logo_zone.get_bounds(1080, 1350)
+        assert logo.w == logo.x2 - logo.x1
+        assert logo.h == logo.y2 - logo.y1
 
 
 # =============================================================================
@@ -228,7 +258,14 @@ class TestProductPlacer:
         
         assert resized.width == 500
         assert resized.height == 250  # Maintains aspect ratio
-    
+
+    def test_resize_product_image_large_downscale(self):
+        """Test large downscales (reducing_gap path) hit the exact target size."""
+        img = Image.new("RGBA", (4000, 2000), (255, 0, 0, 255))
+        resized = resize_product_image(img, 600)
+
+        assert resized.size == (600, 300)
+
     def test_resize_product_image_no_upscale(self):
         """Test that small images are not upscaled."""
         img = Image.new("RGBA", (200, 200), (255, 0, 0, 255))
@@ -282,6 +319,56 @@ class TestProductPlacer:
         
         assert has_transparency(img) is False
     
+    def test_remove_background_uses_disk_cache(self, tmp_path: Path, monkeypatch):
+        """Test repeat images skip rembg once the result is cached."""
+        monkeypatch.setattr(get_settings(), "cache_dir", tmp_path)
+        img = Image.new("RGB", (64, 64), (255, 0, 0))
+        
+        with patch("src.composition.product_placer._run_rembg") as mock_rembg:
+            mock_rembg.return_value = Image.new("RGBA", (64, 64), (255, 0, 0, 0))
+            first = remove_background(img)
+            second = remove_background(img.copy())
+        
+        assert mock_rembg.call_count == 1
+        assert second.mode == "RGBA"
+        assert second.tobytes() == first.tobytes()
+    
+    @pytest.mark.asyncio
+    async def test_load_product_image_refetches_after_ttl(self, tmp_path: Path, monkeypatch):
+        """Test cached product URLs are reused within the TTL and refetched after it."""
+        import io
+        import os
+        from collections import OrderedDict
+        from src.composition import product_placer
+        
+        monkeypatch.setattr(get_settings(), "cache_dir", tmp_path)
+        monkeypatch.setattr(get_settings(), "remote_image_cache_ttl", 60)
+        monkeypatch.setattr(product_placer, "_remote_image_cache", OrderedDict())
+        
+        def png_response(color):
+            buffer = io.BytesIO()
+            Image.new("RGB", (8, 8), color).save(buffer, "PNG")
+            return MagicMock(content=buffer.getvalue())
+        
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=[png_response((255, 0, 0)), png_response((0, 0, 255))])
+        url = "https://example.com/product.png"
+        
+        with patch("src.composition.product_placer.get_http_client", return_value=client):
+            first = await load_product_image(url)
+            product_placer._remote_image_cache.clear()
+            from_disk = await load_product_image(url)
+            
+            # Age the disk entry past the TTL
+            cache_file = next((tmp_path / "remote").iterdir())
+            os.utime(cache_file, (0, 0))
+            product_placer._remote_image_cache.clear()
+            refreshed = await load_product_image(url)
+        
+        assert client.get.call_count == 2
+        assert from_disk.getpixel((0, 0)) == first.getpixel((0, 0)) == (255, 0, 0, 255)
+        assert refreshed.getpixel((0, 0)) == (0, 0, 255, 255)
+    
     def test_apply_drop_shadow(self):
         """Test drop shadow application."""
         img = Image.new("RGBA", (100, 100), (255, 0, 0, 255))
@@ -290,6 +377,32 @@ class TestProductPlacer:
         # Result should be larger to accommodate shadow
         assert result.width > img.width
         assert result.height > img.height
+    
+    @pytest.mark.asyncio
+    async def test_close_http_client(self):
+        """Test the pooled client is closed and replaced on next use."""
+        from src.utils.image_utils import close_http_client, get_http_client
+        
+        client = get_http_client()
+        await close_http_client()
+        
+        assert client.is_closed
+        assert get_http_client() is not client
+        await close_http_client()
+    
+    def test_resize_image_uses_in_memory_pixels(self, tmp_path: Path):
+        """Test resize_image resizes the edited image, not the file it came from."""
+        from src.utils.image_utils import resize_image
+        
+        path = tmp_path / "white.jpg"
+        Image.new("RGB", (800, 800), (255, 255, 255)).save(path)
+        
+        with Image.open(path) as image:
+            ImageDraw.Draw(image).rectangle((0, 0, 799, 799), fill=(0, 0, 0))
+            resized = resize_image(image, 100, 100)
+        
+        assert resized.size == (100, 100)
+        assert resized.getpixel((50, 50)) == (0, 0, 0)
 
 
 # =============================================================================
@@ -322,6 +435,13 @@ class TestTextRenderer:
         
         assert len(lines) > 1
     
+    def test_load_font_is_cached(self):
+        """Test repeat font loads reuse the same FreeType font."""
+        load_font.cache_clear()
+        
+        assert load_font("bold", 40) is load_font("bold", 40)
+        assert load_font("bold", 40) is not load_font("regular", 40)
+    
     def test_wrap_text_empty(self):
         """Test wrapping empty text."""
         font = load_font("regular", 24)
@@ -338,6 +458,33 @@ class TestTextRenderer:
         assert size[0] > 0
         assert size[1] > 0
     
+    def test_render_headline_accepts_pixel_rect(self):
+        """Test renderers give identical output for a zone and its PixelRect."""
+        zone = get_layout_spec("Minimal Product Focus").headline_zone
+        from_zone = Image.new("RGBA", (1080, 1080), (20, 20, 20, 255))
+        from_rect = from_zone.copy()
+        
+        _, zone_height = render_headline(from_zone, "Built for Focus", zone, "#FFFFFF")
+        _, rect_height = render_headline(
+            from_rect, "Built for Focus", zone.to_pixels(1080, 1080), "#FFFFFF"
+        )
+        
+        assert rect_height == zone_height
+        assert from_rect.tobytes() == from_zone.tobytes()
+    
+    def test_draw_text_matches_imagedraw(self):
+        """Test cached glyph rendering is pixel-identical to ImageDraw.text."""
+        font = load_font("bold", 32)
+        
+        for text in ("Shop Now", "Line one\nLine two"):
+            expected = Image.new("RGBA", (400, 120), (40, 80, 120, 255))
+            actual = expected.copy()
+            
+            ImageDraw.Draw(expected).text((12, 10), text, font=font, fill="#00000080")
+            draw_text(ImageDraw.Draw(actual), (12, 10), text, font, "#00000080")
+            
+            assert actual.tobytes() == expected.tobytes(), text
+    
     def test_get_text_size_empty(self):
         """Test text size for empty lines."""
         font = load_font("regular", 24)
@@ -389,6 +536,38 @@ class TestCompositor:
         assert result.width == 1080
         assert result.height == 1080
     
+    @pytest.mark.asyncio
+    async def test_compositor_uses_in_memory_background(
+        self,
+        sample_product_image: Path,
+        sample_store_brand: BrandContext,
+        sample_channel: ChannelContext,
+        sample_concept: CreativeConcept,
+        sample_ad_copy: AdCopy,
+        tmp_path: Path,
+    ):
+        """Test an already-decoded background is used without reading the path."""
+        background = Image.new("RGB", (540, 540), (30, 30, 60))
+        
+        with patch("src.composition.product_placer.remove_background") as mock_rembg:
+            mock_rembg.return_value = Image.new("RGBA", (500, 500), (255, 0, 0, 255))
+            
+            input = CompositionInput(
+                background_path=str(tmp_path / "missing.png"),
+                background_image=background,
+                product_image_source=str(sample_product_image),
+                ad_copy=sample_ad_copy,
+                concept=sample_concept,
+                store_brand=sample_store_brand,
+                channel=sample_channel,
+                output_path=str(tmp_path / "ad.png"),
+            )
+            
+            result = await Compositor().compose(input)
+        
+        assert (result.width, result.height) == (1080, 1080)
+        assert background.size == (540, 540)
+    
     @pytest.mark.asyncio
     async def test_compositor_exact_dimensions(
         self,
@@ -471,6 +650,55 @@ class TestCompositor:
         output_image = Image.open(result.path)
         assert output_image.format == "JPEG"
     
+    @pytest.mark.asyncio
+    async def test_compose_ad_closes_http_client(
+        self,
+        sample_background_image: Path,
+        sample_store_brand: BrandContext,
+        sample_channel: ChannelContext,
+        sample_concept: CreativeConcept,
+        sample_ad_copy: AdCopy,
+        tmp_path: Path,
+    ):
+        """Test compose_ad closes the loop's pooled client even when composing fails."""
+        with patch(
+            "src.composition.compositor.close_http_client", new_callable=AsyncMock
+        ) as mock_close:
+            with pytest.raises(FileNotFoundError):
+                await compose_ad(
+                    background_path=str(sample_background_image),
+                    product_image_source=str(tmp_path / "missing.png"),
+                    ad_copy=sample_ad_copy,
+                    concept=sample_concept,
+                    store_brand=sample_store_brand,
+                    channel=sample_channel,
+                    output_path=str(tmp_path / "ad.png"),
+                )
+        
+        mock_close.assert_awaited_once()
+    
+    def test_save_image_png_compress_level(self, tmp_path: Path):
+        """Test fast PNG compression is lossless."""
+        image = Image.new("RGBA", (64, 64), (10, 20, 30, 128))
+        output_path = Compositor()._save_image(
+            image, str(tmp_path / "fast.png"), "PNG", compress_level=1
+        )
+        
+        with Image.open(output_path) as saved:
+            assert saved.format == "PNG"
+            assert saved.tobytes() == image.tobytes()
+    
+    def test_warm_caches_preloads_layout_fonts(self):
+        """Test warm-up loads the fonts a canvas size will render with."""
+        load_font.cache_clear()
+        warm_caches(1080, 1350)
+        hits = load_font.cache_info().hits
+        
+        layout = get_layout_spec("Hero Product with Stat Overlay")
+        load_font("bold", int(1350 * layout.headline_font_ratio))
+        
+        assert load_font.cache_info().hits == hits + 1
+    
     def test_composition_input_validation(self):
         """Test CompositionInput validation."""
         # Should raise on missing required fields